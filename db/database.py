@@ -4,6 +4,7 @@ import os
 import sys
 import time
 import threading
+import functools
 
 # Configure logging
 logging.basicConfig(
@@ -21,8 +22,9 @@ IS_DEV_MODE = (not IS_FROZEN) and (not IS_PROD_MODE)
 if IS_DEV_MODE:
     logging.info("Development mode detected: Using test database by default")
 
+@functools.lru_cache(maxsize=None)
 def get_user_data_dir():
-    """Get the user-specific data directory"""
+    """Get the user-specific data directory (created on the first call, then cached)"""
     if sys.platform == 'darwin':
         data_dir = os.path.expanduser('~/Library/Application Support/OrderWizard')
     elif sys.platform == 'win32':
@@ -62,6 +64,14 @@ def resource_path(relative_path):
         logging.error(f"Error getting resource path: {e}")
         return relative_path
 
+# Settings applied to every new SQLite connection
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
 class DatabaseError(Exception):
     """Custom exception for database errors"""
     pass
@@ -84,6 +94,10 @@ class ConnectionPool:
                 # Ensure the database directory exists
                 os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
                 conn = sqlite3.connect(self.db_path, check_same_thread=False)
+                # WAL lets readers run alongside a writer and needs fewer fsyncs per
+                # commit; temp tables stay in memory and pages are read through mmap
+                for pragma in SQLITE_PRAGMAS:
+                    conn.execute(pragma)
                 self.connection_locks[id(conn)] = threading.Lock()
             return conn
                 
@@ -272,25 +286,21 @@ class Database:
         """Retrieve an order by its ID"""
         def _operation(conn):
             try:
-                logging.info(f"Database: Getting order with ID {order_id}")
+                logging.info("Database: Getting order with ID %s", order_id)
                 cursor = conn.cursor()
                 cursor.execute('SELECT * FROM orders WHERE id = ?', (order_id,))
                 result = cursor.fetchone()
                 
                 if result:
-                    logging.info(f"Database: Found order {order_id} - {result[1]}")
+                    logging.info("Database: Found order %s - %s", order_id, result[1])
                 else:
-                    logging.warning(f"Database: Order {order_id} not found in database")
+                    logging.warning("Database: Order %s not found in database", order_id)
                     
-                    # Debug: Get a count of all orders
-                    cursor.execute('SELECT COUNT(*) FROM orders')
-                    count = cursor.fetchone()[0]
-                    logging.info(f"Database: Total order count: {count}")
-                    
-                    # Debug: Get the highest order ID
-                    cursor.execute('SELECT MAX(id) FROM orders')
-                    max_id = cursor.fetchone()[0]
-                    logging.info(f"Database: Highest order ID: {max_id}")
+                    # Extra diagnostics cost additional queries, so only run them when debugging
+                    if logging.getLogger().isEnabledFor(logging.DEBUG):
+                        cursor.execute('SELECT COUNT(*), MAX(id) FROM orders')
+                        count, max_id = cursor.fetchone()
+                        logging.debug("Database: Total order count: %s, highest order ID: %s", count, max_id)
                 
                 return result
             except sqlite3.Error as e:
@@ -307,7 +317,8 @@ class Database:
         def _operation(conn):
             try:
                 cursor = conn.cursor()
-                cursor.execute('SELECT * FROM orders ORDER BY created_at ASC')
+                # Break created_at ties by id so pages and full reads agree on the order
+                cursor.execute('SELECT * FROM orders ORDER BY created_at ASC, id ASC')
                 return cursor.fetchall()
             except sqlite3.Error as e:
                 logging.error(f"Database error: {e}")
@@ -318,6 +329,25 @@ class Database:
         
         return self._execute_with_lock(_operation)
 
+    def get_orders_page(self, offset, limit):
+        """Retrieve up to limit orders in the same order as get_all_orders, skipping the first offset"""
+        def _operation(conn):
+            try:
+                cursor = conn.cursor()
+                cursor.execute(
+                    'SELECT * FROM orders ORDER BY created_at ASC, id ASC LIMIT ? OFFSET ?',
+                    (limit, offset)
+                )
+                return cursor.fetchall()
+            except sqlite3.Error as e:
+                logging.error(f"Database error: {e}")
+                raise DatabaseError(str(e))
+            except Exception as e:
+                logging.error(f"Exception in get_orders_page: {e}")
+                raise
+        
+        return self._execute_with_lock(_operation)
+
     def insert_order(self, order):
         """Insert a new order after validation"""
         def _operation(conn):
@@ -360,6 +390,32 @@ class Database:
         
         return self._execute_with_lock(_operation)
 
+    def remove_orders(self, order_ids):
+        """Remove several orders by ID in one transaction, returning the IDs that were removed"""
+        def _operation(conn):
+            try:
+                cursor = conn.cursor()
+                existing = []
+                # Stay under SQLite's limit on the number of bound parameters
+                for start in range(0, len(order_ids), 500):
+                    batch = tuple(order_ids[start:start + 500])
+                    placeholders = ', '.join('?' * len(batch))
+                    cursor.execute(f'SELECT id FROM orders WHERE id IN ({placeholders})', batch)
+                    existing.extend(row[0] for row in cursor.fetchall())
+                    cursor.execute(f'DELETE FROM orders WHERE id IN ({placeholders})', batch)
+                conn.commit()
+                return existing
+            except sqlite3.Error as e:
+                # Don't leave a partial batch pending on the pooled connection
+                conn.rollback()
+                logging.error(f"Database error: {e}")
+                raise DatabaseError(str(e))
+            except Exception as e:
+                logging.error(f"Exception in remove_orders: {e}")
+                raise
+        
+        return self._execute_with_lock(_operation)
+
     def update_order(self, order_id, order):
         """Update an existing order after validation"""
         def _operation(conn):
@@ -398,25 +454,22 @@ class Database:
         """Get an order by its order number"""
         def _operation(conn):
             try:
-                logging.info(f"Database: Getting order with number {order_number}")
+                logging.info("Database: Getting order with number %s", order_number)
                 cursor = conn.cursor()
                 cursor.execute('SELECT * FROM orders WHERE order_number = ?', (order_number,))
                 result = cursor.fetchone()
                 
                 if result:
-                    logging.info(f"Database: Found order {order_number} - ID: {result[0]}")
+                    logging.info("Database: Found order %s - ID: %s", order_number, result[0])
                 else:
-                    logging.warning(f"Database: Order {order_number} not found in database")
-                    
-                    # Debug: Get a count of all orders
-                    cursor.execute('SELECT COUNT(*) FROM orders')
-                    count = cursor.fetchone()[0]
-                    logging.info(f"Database: Total order count: {count}")
+                    logging.warning("Database: Order %s not found in database", order_number)
                     
-                    # Debug: Get all order numbers
-                    cursor.execute('SELECT order_number FROM orders')
-                    all_orders = cursor.fetchall()
-                    logging.info(f"Database: Available order numbers: {[o[0] for o in all_orders]}")
+                    # Listing every order number is a full table scan, so only do it when debugging
+                    if logging.getLogger().isEnabledFor(logging.DEBUG):
+                        cursor.execute('SELECT order_number FROM orders')
+                        all_orders = cursor.fetchall()
+                        logging.debug("Database: Total order count: %d", len(all_orders))
+                        logging.debug("Database: Available order numbers: %s", [o[0] for o in all_orders])
                 
                 return result
             except sqlite3.Error as e:
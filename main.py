@@ -37,7 +37,6 @@ except ImportError:
     DND_FILES = None
     TkinterDnD = tk.Tk
 
-from ui.view.add_order_view import AddOrderView
 from ui.view.order_list_view import OrderListView
 from ui.viewmodel.order_list_viewmodel import OrderListViewModel
 
@@ -133,20 +132,10 @@ class MainApplication:
             # Show the initial screen
             logging.info("Showing initial order list screen")
             self.show_order_list()
-            
-            # Load orders in background after UI is shown
-            threading.Thread(target=self._load_orders_background, daemon=True).start()
         else:
             # Check again in 100ms
             self.root.after(100, self._finish_initialization)
     
-    def _load_orders_background(self):
-        """Load orders in the background and update UI when done"""
-        try:
-            self.order_list_viewmodel.load_orders()
-        except Exception as e:
-            logging.error(f"Error loading orders: {e}")
-        
     def show_order_list(self):
         """Show the order list screen"""
         try:
@@ -166,6 +155,8 @@ class MainApplication:
             logging.info("Showing add order screen")
             if self.current_screen:
                 self.current_screen.destroy()
+            # Imported on first use so PIL and the OCR view aren't loaded at startup
+            from ui.view.add_order_view import AddOrderView
             self.current_screen = AddOrderView(self.root, self.order_list_viewmodel)
             # Add back button
             back_button = ttk.Button(
@@ -233,6 +224,10 @@ def main():
             
             logging.info("Entering main event loop")
             root.mainloop()
+            
+            # Close the database explicitly rather than relying on garbage collection
+            if app.order_list_viewmodel:
+                app.order_list_viewmodel.close()
         except Exception as e:
             splash.destroy()  # Ensure splash is closed on error
             logging.error(f"Application initialization error: {e}")
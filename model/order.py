@@ -3,6 +3,15 @@ import re
 from datetime import datetime
 from typing import Optional
 
+# Fields shown in the order list; changing any of them invalidates Order.row_values
+_ROW_FIELDS = frozenset({
+    'order_number', 'amount', 'note',
+    'comment_with_picture', 'commented', 'revealed', 'reimbursed'
+})
+
+# Display text for status flags, indexed by the flag's truth value
+_YES_NO = ("No", "Yes")
+
 @dataclass
 class Order:
     id: Optional[int] = None
@@ -16,6 +25,60 @@ class Order:
     reimbursed_amount: float = 0.0
     note: Optional[str] = None
 
+    def __setattr__(self, name, value):
+        if name in _ROW_FIELDS:
+            self.__dict__.pop('_row_values', None)
+            if name == 'order_number':
+                self.__dict__.pop('_order_number_lower', None)
+            elif name == 'amount':
+                self.__dict__.pop('_amount_display', None)
+        super().__setattr__(name, value)
+
+    @property
+    def order_number_lower(self) -> str:
+        """Lowercased order number for searching, cached until the order number changes"""
+        order_number_lower = self.__dict__.get('_order_number_lower')
+        if order_number_lower is None:
+            order_number_lower = str(self.order_number).lower()
+            self.__dict__['_order_number_lower'] = order_number_lower
+        return order_number_lower
+
+    @property
+    def amount_display(self) -> str:
+        """Amount formatted as dollars, cached until the amount changes"""
+        amount_display = self.__dict__.get('_amount_display')
+        if amount_display is None:
+            amount_display = '$' + format(self.amount, '.2f')
+            self.__dict__['_amount_display'] = amount_display
+        return amount_display
+
+    @property
+    def amount_cents(self) -> int:
+        """Amount in whole cents, for exact comparisons"""
+        return round(self.amount * 100)
+
+    @property
+    def is_completed(self) -> bool:
+        """Whether the order has been commented, revealed and reimbursed"""
+        return bool(self.commented and self.revealed and self.reimbursed)
+
+    @property
+    def row_values(self) -> tuple:
+        """Display strings for the order list, cached until a shown field changes"""
+        row_values = self.__dict__.get('_row_values')
+        if row_values is None:
+            row_values = (
+                self.order_number,
+                self.amount_display,
+                self.note or "",
+                _YES_NO[bool(self.comment_with_picture)],
+                _YES_NO[bool(self.commented)],
+                _YES_NO[bool(self.revealed)],
+                _YES_NO[bool(self.reimbursed)]
+            )
+            self.__dict__['_row_values'] = row_values
+        return row_values
+
     @staticmethod
     def parse_order_text(order_text: str) -> 'Order':
         """
@@ -85,6 +148,22 @@ class Order:
         except Exception as e:
             raise ValueError(f"Error creating order: {str(e)}")
 
+    @staticmethod
+    def from_row(row) -> 'Order':
+        """Create an order from a database row (column order matches to_tuple)"""
+        return Order(
+            id=row[0],
+            order_number=row[1],
+            amount=row[2],
+            image_uri=row[3],
+            comment_with_picture=row[4],
+            commented=row[5],
+            revealed=row[6],
+            reimbursed=row[7],
+            reimbursed_amount=row[8],
+            note=row[9]
+        )
+
     def to_tuple(self):
         """Convert order to tuple for database storage"""
         return (
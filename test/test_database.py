@@ -12,7 +12,7 @@ class TestDatabase(unittest.TestCase):
             order_number="123-4567890-1234567",
             amount=99.99,
             image_uri="path/to/test/image.jpg",
-            comment_in_picture=True,
+            comment_with_picture=True,
             commented=False,
             revealed=True,
             reimbursed=False,
@@ -22,8 +22,12 @@ class TestDatabase(unittest.TestCase):
     def tearDown(self):
         """Clean up after each test"""
         self.db.close()
-        if os.path.exists(self.test_db_name):
-            os.remove(self.test_db_name)
+        # Database is a singleton; drop it so the next test opens a fresh file
+        Database._instance = None
+        # WAL mode keeps -wal/-shm files next to the database
+        for path in (self.test_db_name, f"{self.test_db_name}-wal", f"{self.test_db_name}-shm"):
+            if os.path.exists(path):
+                os.remove(path)
 
     def test_database_initialization(self):
         """Test database initialization and structure verification"""
@@ -54,7 +58,7 @@ class TestDatabase(unittest.TestCase):
             order_number=self.sample_order.order_number,
             amount=199.99,  # Changed amount
             image_uri=self.sample_order.image_uri,
-            comment_in_picture=True,
+            comment_with_picture=True,
             commented=True,  # Changed commented status
             revealed=True,
             reimbursed=True,  # Changed reimbursed status
@@ -12,7 +12,7 @@ class TestDatabase(unittest.TestCase):
             order_number="123-4567890-1234567",
             amount=99.99,
             image_uri="path/to/test/image.jpg",
-            comment_in_picture=True,
+            comment_with_picture=True,
             commented=False,
             revealed=True,
             reimbursed=False,
@@ -22,8 +22,12 @@ class TestDatabase(unittest.TestCase):
     def tearDown(self):
         """Clean up after each test"""
         self.db.close()
-        if os.path.exists(self.test_db_name):
-            os.remove(self.test_db_name)
+        # Database is a singleton; drop it so the next test opens a fresh file
+        Database._instance = None
+        # WAL mode keeps -wal/-shm files next to the database
+        for path in (self.test_db_name, f"{self.test_db_name}-wal", f"{self.test_db_name}-shm"):
+            if os.path.exists(path):
+                os.remove(path)
 
     def test_database_initialization(self):
         """Test database initialization and structure verification"""
@@ -54,7 +58,7 @@ class TestDatabase(unittest.TestCase):
             order_number=self.sample_order.order_number,
             amount=199.99,  # Changed amount
             image_uri=self.sample_order.image_uri,
-            comment_in_picture=True,
+            comment_with_picture=True,
             commented=True,  # Changed commented status
             revealed=True,
             reimbursed=True,  # Changed reimbursed status
@@ -109,6 +113,17 @@ class TestDatabase(unittest.TestCase):
         self.assertEqual(all_orders[0][1], "ORDER-1")
         self.assertEqual(all_orders[-1][1], "ORDER-3")
 
+    def test_get_orders_page(self):
+        """Test retrieving orders one page at a time"""
+        for i in range(1, 6):
+            self.db.insert_order(Order(order_number=f"ORDER-{i}", amount=float(i*10)))
+        
+        # Pages follow the same order as get_all_orders
+        first_page = self.db.get_orders_page(0, 2)
+        last_page = self.db.get_orders_page(4, 2)
+        self.assertEqual([row[1] for row in first_page], ["ORDER-1", "ORDER-2"])
+        self.assertEqual([row[1] for row in last_page], ["ORDER-5"])
+
     def test_invalid_order_insert(self):
         """Test inserting invalid order data"""
         invalid_order = Order(
@@ -126,6 +141,19 @@ class TestDatabase(unittest.TestCase):
         success = self.db.update_order(999, self.sample_order)
         self.assertFalse(success)
 
+    def test_remove_orders(self):
+        """Test removing several orders at once"""
+        first_id = self.db.insert_order(self.sample_order)
+        second_id = self.db.insert_order(self.sample_order)
+        
+        # Only existing orders are reported as removed
+        removed = self.db.remove_orders([first_id, second_id, 999])
+        self.assertEqual(sorted(removed), sorted([first_id, second_id]))
+        
+        # Verify orders no longer exist
+        self.assertIsNone(self.db.get_order_by_id(first_id))
+        self.assertIsNone(self.db.get_order_by_id(second_id))
+
     def test_remove_nonexistent_order(self):
         """Test removing an order that doesn't exist"""
         success = self.db.remove_order(999)
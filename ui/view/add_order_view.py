@@ -1,7 +1,6 @@
 import tkinter as tk
 from tkinter import ttk
 from tkinter import filedialog, messagebox
-from PIL import Image, ImageTk
 import os
 import sys
 import logging
@@ -9,6 +8,8 @@ from ui.viewmodel.order_list_viewmodel import OrderListViewModel
 from model.order import Order
 import re
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 try:
     from tkinterdnd2 import DND_FILES, TkinterDnD
@@ -17,18 +18,32 @@ except ImportError:
     DND_FILES = None
     TkinterDnD = tk.Tk
 
+# Paths used by resource_path, evaluated once at import
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+_PROJECT_ROOT = os.path.normpath(os.path.join(_MODULE_DIR, '..', '..'))
+_DARWIN_RESOURCES = os.path.join(os.path.dirname(sys.executable), '..', 'Resources')
+_HAS_DARWIN_RESOURCES = (
+    getattr(sys, 'frozen', False)
+    and sys.platform == 'darwin'
+    and os.path.exists(_DARWIN_RESOURCES)
+)
+
+# File extensions accepted as order images
+_IMAGE_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg', '.gif', '.bmp'})
+
+# Worker pool for decoding image previews off the Tk main thread
+_PREVIEW_POOL = ThreadPoolExecutor(max_workers=1)
+
 def resource_path(relative_path):
     """Get absolute path to resource, works for dev and for PyInstaller"""
     try:
         # PyInstaller creates a temp folder and stores path in _MEIPASS
         if getattr(sys, 'frozen', False):
-            base_path = sys._MEIPASS
             # Check if we're in app bundle on macOS
-            if sys.platform == 'darwin' and os.path.exists(os.path.join(os.path.dirname(sys.executable), '..', 'Resources')):
-                resources_path = os.path.join(os.path.dirname(sys.executable), '..', 'Resources')
-                return os.path.join(resources_path, relative_path)
-            return os.path.join(base_path, relative_path)
-        return os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', relative_path)
+            if _HAS_DARWIN_RESOURCES:
+                return os.path.join(_DARWIN_RESOURCES, relative_path)
+            return os.path.join(sys._MEIPASS, relative_path)
+        return os.path.join(_PROJECT_ROOT, relative_path)
     except Exception as e:
         logging.error(f"Error getting resource path: {e}")
         return relative_path
@@ -43,6 +58,10 @@ class AddOrderView(ttk.Frame):
         self.current_image_display = None
         self.current_image_path = None
         self.ocr_in_progress = False
+        self._preview_future = None  # Preview image still being decoded
+        
+        # OCR is only used on this screen, so load it now rather than at startup
+        self.viewmodel.preload_ocr()
         
         # Set up drop target registration
         self.drop_target_register = self.register_drop_target if hasattr(self, 'register_drop_target') else None
@@ -225,8 +244,11 @@ class AddOrderView(ttk.Frame):
         # Use after to ensure thread safety
         self.after(0, lambda: self.ocr_indicator.configure(text=message))
             
-    def _on_ocr_complete(self, success, result):
+    def _on_ocr_complete(self, image_path, success, result):
         """Callback for when OCR completes"""
+        # Ignore results for an image the user has since replaced or cleared
+        if image_path != self.current_image_path:
+            return
         if success:
             # Try to clean up the text
             cleaned_text = self._clean_ocr_text(result)
@@ -280,7 +302,7 @@ class AddOrderView(ttk.Frame):
                 return
                 
             # Otherwise register for callback when OCR completes
-            self.viewmodel.set_ocr_callback(file_path, self._on_ocr_complete)
+            self.viewmodel.set_ocr_callback(file_path, partial(self._on_ocr_complete, file_path))
                 
         except Exception as e:
             logging.error(f"Error processing image: {e}")
@@ -353,35 +375,45 @@ class AddOrderView(ttk.Frame):
 
     def _is_valid_image(self, file_path):
         """Check if the file is a valid image"""
-        return file_path.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.bmp'))
+        return os.path.splitext(file_path)[1].lower() in _IMAGE_EXTENSIONS
         
     def _update_image_preview(self, file_path):
         """Update the image preview"""
-        try:
-            # Open and resize image
-            image = Image.open(file_path)
-            
-            # Calculate resize dimensions while maintaining aspect ratio
-            display_width = 300  # Maximum width for display
-            display_height = 300  # Maximum height for display
-            
-            # Calculate aspect ratio
-            aspect_ratio = image.width / image.height
-            
-            if aspect_ratio > 1:
-                # Width is greater than height
-                new_width = display_width
-                new_height = int(display_width / aspect_ratio)
-            else:
-                # Height is greater than width
-                new_height = display_height
-                new_width = int(display_height * aspect_ratio)
-            
-            # Resize image
-            image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        # Show a placeholder while the image is decoded in the background
+        self.image_label.configure(image="", text="Loading image...")
+        self.current_image_display = None
+        
+        self._preview_future = _PREVIEW_POOL.submit(self._load_preview_image, file_path)
+        # Hand the result back to the Tk main thread when the worker finishes
+        self._preview_future.add_done_callback(
+            lambda future: self.after(0, self._attach_preview, future)
+        )
+        
+    @staticmethod
+    def _load_preview_image(file_path):
+        """Decode and downscale an image for the preview (runs in a worker thread)"""
+        # Imported here so PIL is only loaded once an image is actually shown
+        from PIL import Image
+        
+        # Let libjpeg decode at a reduced scale, then shrink to fit the
+        # 300x300 preview (thumbnail keeps the aspect ratio)
+        image = Image.open(file_path)
+        image.draft('RGB', (300, 300))
+        image.thumbnail((300, 300), Image.Resampling.LANCZOS)
+        image.load()
+        return image
+        
+    def _attach_preview(self, future):
+        """Show a decoded preview image (runs on the Tk main thread)"""
+        # Ignore previews for an image that has since been replaced or cleared
+        if future is not self._preview_future:
+            return
             
-            # Convert to PhotoImage
-            photo = ImageTk.PhotoImage(image)
+        self._preview_future = None
+        try:
+            # Convert to PhotoImage, which must happen on the Tk main thread
+            from PIL import ImageTk
+            photo = ImageTk.PhotoImage(future.result())
             
             # Update label with image
             self.image_label.configure(image=photo, text="")
@@ -389,6 +421,7 @@ class AddOrderView(ttk.Frame):
             
         except Exception as e:
             logging.error(f"Error loading image preview: {e}")
+            self.image_label.configure(text="")
             self._show_status(f"Error loading image preview: {str(e)}", True)
 
     def submit_order(self):
@@ -398,8 +431,12 @@ class AddOrderView(ttk.Frame):
             self._show_status("Text extraction is still in progress. Please wait.", True)
             return
         
+        # Skip re-submitting text that hasn't changed since the last successful submit
+        if not self.text_area.edit_modified():
+            self._show_status("Nothing to submit", True)
+            return
+        
         order_text = self.text_area.get("1.0", tk.END).strip()
-        note_text = self.note_area.get("1.0", tk.END).strip()
         
         if not order_text:
             self._show_status("Please enter order details", True)
@@ -415,6 +452,9 @@ class AddOrderView(ttk.Frame):
                 
                 # Clear form
                 self.clear_form()
+                
+                # Reset modified flag (clearing the form sets it again)
+                self.text_area.edit_modified(False)
             else:
                 self._show_status("Failed to add order", True)
                 
@@ -438,6 +478,7 @@ class AddOrderView(ttk.Frame):
         self.note_area.delete("1.0", tk.END)
         
         # Clear image
+        self._preview_future = None
         self.image_label.configure(image="", text="Click 'Browse' to select an image or drop an image here")
         self.current_image_display = None
         self.current_image_path = None
@@ -454,15 +495,12 @@ class AddOrderView(ttk.Frame):
     def _on_drop(self, event):
         """Handle drag and drop events"""
         try:
-            # Get the file path from the event
-            file_path = event.data
-            
-            # Remove curly braces if present (Windows)
-            if file_path.startswith('{') and file_path.endswith('}'):
-                file_path = file_path[1:-1]
+            # The event holds a Tcl list of paths, brace-quoted when they contain spaces
+            file_paths = self.tk.splitlist(event.data)
             
-            # Process the dropped image
-            if self._is_valid_image(file_path):
+            # Process the first dropped image
+            file_path = next((path for path in file_paths if self._is_valid_image(path)), None)
+            if file_path:
                 self._process_image(file_path)
             else:
                 self._show_status("Please drop a valid image file (PNG, JPG, JPEG, GIF, BMP)", True)
@@ -1,37 +1,74 @@
 import tkinter as tk
 from tkinter import ttk
-from tkinter import messagebox
-from PIL import Image, ImageTk
 import os
 import sys
 import logging
-from ui.viewmodel.order_list_viewmodel import OrderListViewModel
-from model.order import Order
+from dataclasses import replace
+from collections import deque, OrderedDict
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+from ui.viewmodel.order_list_viewmodel import OrderListViewModel, flatten_to_rgb
 
-def resource_path(relative_path):
-    """Get absolute path to resource, works for dev and for PyInstaller"""
+def _compute_base():
+    """Compute the base directory for resources, works for dev and for PyInstaller"""
     try:
         # PyInstaller creates a temp folder and stores path in _MEIPASS
         if getattr(sys, 'frozen', False):
-            base_path = sys._MEIPASS
             # Check if we're in app bundle on macOS
-            if sys.platform == 'darwin' and os.path.exists(os.path.join(os.path.dirname(sys.executable), '..', 'Resources')):
-                resources_path = os.path.join(os.path.dirname(sys.executable), '..', 'Resources')
-                return os.path.join(resources_path, relative_path)
-            return os.path.join(base_path, relative_path)
-        return os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', relative_path)
+            resources_path = os.path.join(os.path.dirname(sys.executable), '..', 'Resources')
+            if sys.platform == 'darwin' and os.path.exists(resources_path):
+                return resources_path
+            return sys._MEIPASS
+        return os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..')
     except Exception as e:
         logging.error(f"Error getting resource path: {e}")
-        return relative_path
+        return ''
+
+# The base directory can't change while the process runs, so resolve it once
+_BASE = _compute_base()
+
+def resource_path(relative_path):
+    """Get absolute path to resource, works for dev and for PyInstaller"""
+    return os.path.join(_BASE, relative_path)
+
+# Display text for each order status checkbox
+_STATUS_LABELS = {
+    'comment_with_picture': 'Comment With Picture',
+    'commented': 'Commented',
+    'revealed': 'Revealed',
+    'reimbursed': 'Reimbursed'
+}
+
+# Maximum number of messages kept in the chat history
+CHAT_HISTORY_LIMIT = 200
+
+# Maximum number of photos kept in the shared photo cache
+PHOTO_CACHE_SIZE = 32
+
+# Worker pool for decoding and resizing images off the Tk main thread
+_IMG_POOL = ThreadPoolExecutor(max_workers=2)
 
 class EditOrderView(ttk.Frame):
-    def __init__(self, parent, viewmodel: OrderListViewModel, order_id: int, on_close: callable):
+    def __init__(self, parent, viewmodel: OrderListViewModel, order_id: int, on_close: callable,
+                 photo_cache: Optional[OrderedDict] = None):
         super().__init__(parent, padding=20)
         self.parent = parent
         self.viewmodel = viewmodel
         self.order_id = order_id
         self.on_close = on_close
         self.current_image_display = None
+        self._image_future = None
+        self.photo_cache = photo_cache  # (order id, image mtime) -> PhotoImage, shared across dialogs
+        self._photo_key = None
+        self._pending_save_id = None
+        self._pending_status = None
+        self._prev_status_values = {}
+        self._status_clear_after_id = None
+        self._close_after_id = None
+        self._order_content = None
+        self.chat_history = None
+        self._chat_lines = deque(maxlen=CHAT_HISTORY_LIMIT)
         
         logging.info(f"Initializing EditOrderView for order ID: {order_id}")
         
@@ -57,12 +94,12 @@ class EditOrderView(ttk.Frame):
     def _init_ui(self):
         """Initialize all UI components"""
         # Create title
-        title = ttk.Label(
+        self.title_label = ttk.Label(
             self,
             text=f"Edit Order #{self.order.order_number}",  # order number
             font=("Helvetica", 24, "bold")
         )
-        title.pack(pady=(0, 20))
+        self.title_label.pack(pady=(0, 20))
         
         # Status label for feedback
         self.status_label = ttk.Label(
@@ -82,54 +119,83 @@ class EditOrderView(ttk.Frame):
         details_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 10))
         
         # Right side - Image display and LLM chatbox
-        right_frame = ttk.Frame(main_container)
-        right_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self._right_frame = ttk.Frame(main_container)
+        self._right_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self._order_content = self._init_order_content(self._right_frame)
+        
+        # Bottom - Buttons
+        self._init_buttons()
         
+    def _init_order_content(self, parent):
+        """Build the image and chat widgets, which depend on whether the order has an image"""
         if self.order.image_uri:  # image_uri
             # If image exists, show image frame
-            image_frame = self._init_image_frame(right_frame)
-            image_frame.pack(fill=tk.BOTH, expand=True)
+            frame = self._init_image_frame(parent)
         else:
             # If no image, just show the LLM chatbox
-            chat_frame = ttk.LabelFrame(right_frame, text="AI Assistant", padding=10)
-            chat_frame.pack(fill=tk.BOTH, expand=True)
-            self._init_llm_chatbox_content(chat_frame)
+            frame = ttk.LabelFrame(parent, text="AI Assistant", padding=10)
+            self._init_llm_chatbox_placeholder(frame)
+        frame.pack(fill=tk.BOTH, expand=True)
+        return frame
         
-        # Bottom - Buttons
-        self._init_buttons()
+    def load(self, order_id: int):
+        """
+        Show another order in this view, reusing the existing widgets
+        
+        Args:
+            order_id: The ID of the order to edit
+        """
+        order = self.viewmodel.get_order_by_id(order_id)
+        if not order:
+            raise ValueError(f"Order {order_id} not found")
+            
+        # Drop anything still scheduled for the previous order
+        self._cancel_scheduled()
+        self.order_id = order_id
+        self.order = order
+        self._prev_status_values = {}
+        self.chat_history = None
+        self._chat_lines.clear()
+        
+        self.title_label.configure(text=f"Edit Order #{order.order_number}")
+        self.status_label.configure(text="")
+        self.info_label.configure(text=f"Order Number: {order.order_number}\nAmount: {order.amount_display}")
+        for status, cb in self._checkboxes.items():
+            cb.state(['selected' if getattr(order, status) else '!selected'])
+        self.note_area.delete("1.0", tk.END)
+        if order.note:
+            self.note_area.insert("1.0", order.note)
+            
+        # The image and chat area differ between orders, so rebuild just that part
+        self._release_image()
+        self._photo_key = None
+        self._order_content.destroy()
+        self._order_content = self._init_order_content(self._right_frame)
         
     def _init_details_frame(self, parent):
         """Initialize the order details frame"""
         frame = ttk.LabelFrame(parent, text="Order Details", padding=10)
         
         # Order info
-        info_text = f"Order Number: {self.order.order_number}\nAmount: ${self.order.amount:.2f}"
-        info_label = ttk.Label(
+        info_text = f"Order Number: {self.order.order_number}\nAmount: {self.order.amount_display}"
+        self.info_label = ttk.Label(
             frame,
             text=info_text,
             font=("Helvetica", 12)
         )
-        info_label.pack(fill=tk.X, pady=(0, 10))
-        
-        # Status checkboxes
-        self.status_vars = {
-            'comment_with_picture': tk.BooleanVar(value=self.order.comment_with_picture),
-            'commented': tk.BooleanVar(value=self.order.commented),
-            'revealed': tk.BooleanVar(value=self.order.revealed),
-            'reimbursed': tk.BooleanVar(value=self.order.reimbursed)
-        }
-        
-        # Create checkboxes
-        for status, var in self.status_vars.items():
-            # Convert status name to display text
-            display_text = ' '.join(word.capitalize() for word in status.split('_'))
+        self.info_label.pack(fill=tk.X, pady=(0, 10))
+        
+        # Status checkboxes; their selected state is read directly, no Tk variables needed
+        self._checkboxes = {}
+        for status, display_text in _STATUS_LABELS.items():
             cb = ttk.Checkbutton(
                 frame,
                 text=display_text,
-                variable=var,
-                command=lambda s=status: self._on_status_change(s)
+                command=partial(self._on_status_change, status)
             )
+            cb.state(['!alternate', 'selected' if getattr(self.order, status) else '!selected'])
             cb.pack(fill=tk.X, pady=2)
+            self._checkboxes[status] = cb
         
         # Note area
         note_label = ttk.Label(frame, text="Notes:")
@@ -154,26 +220,30 @@ class EditOrderView(ttk.Frame):
             logging.info(f"Loading image: {image_path}")
             
             if os.path.exists(image_path):
-                # Open and resize image
-                image = Image.open(image_path)
-                
-                # Calculate new size while maintaining aspect ratio
-                display_width = 400  # Desired width
-                ratio = display_width / image.width
-                display_height = int(image.height * ratio)
-                
-                image = image.resize((display_width, display_height), Image.Resampling.LANCZOS)
-                photo = ImageTk.PhotoImage(image)
+                self._photo_key = (self.order.id, os.path.getmtime(image_path))
+                cached_photo = self.photo_cache.get(self._photo_key) if self.photo_cache is not None else None
                 
-                # Create and pack image label
-                self.current_image_display = ttk.Label(frame, image=photo)
-                self.current_image_display.image = photo  # Keep a reference
-                self.current_image_display.pack(pady=10)
+                if cached_photo is not None:
+                    # Reuse the photo from the last time this order was opened
+                    self.photo_cache.move_to_end(self._photo_key)
+                    self.current_image_display = ttk.Label(frame, image=cached_photo)
+                    self.current_image_display.image = cached_photo  # Keep a reference
+                    self.current_image_display.pack(pady=10)
+                else:
+                    # Show a placeholder while the image loads in the background
+                    self.current_image_display = ttk.Label(frame, text="Loading image...")
+                    self.current_image_display.pack(pady=10)
+                    
+                    self._image_future = _IMG_POOL.submit(self._load_display_image, image_path)
+                    # Hand the result back to the Tk main thread when the worker finishes
+                    self._image_future.add_done_callback(
+                        lambda future: self.after(0, self._attach_photo, future)
+                    )
                 
                 # Add chat frame below image
                 chat_frame = ttk.LabelFrame(frame, text="AI Assistant", padding=10)
                 chat_frame.pack(fill=tk.BOTH, expand=True)
-                self._init_llm_chatbox_content(chat_frame)
+                self._init_llm_chatbox_placeholder(chat_frame)
             else:
                 logging.error(f"Image file not found: {image_path}")
                 error_label = ttk.Label(
@@ -193,6 +263,50 @@ class EditOrderView(ttk.Frame):
         
         return frame
         
+    def _load_display_image(self, image_path):
+        """Decode and downscale an image for display (runs in a worker thread)"""
+        from PIL import Image
+        # Open the cached thumbnail instead of decoding the full image
+        thumbnail_path = self.viewmodel.get_thumbnail_path(image_path)
+        if thumbnail_path:
+            image = Image.open(thumbnail_path)
+        else:
+            # Fall back to resizing the original image
+            image = Image.open(image_path)
+            image.draft('RGB', (400, 400))
+            image.thumbnail((400, 400), Image.Resampling.LANCZOS, reducing_gap=3.0)
+        # Composite any transparency onto white; RGB also keeps Tk's copy of the pixels smaller
+        image = flatten_to_rgb(image)
+        image.load()
+        return image
+        
+    def _attach_photo(self, future):
+        """Attach the loaded image to the placeholder (runs on the Tk main thread)"""
+        if future is not self._image_future or future.cancelled() or self.current_image_display is None:
+            return
+            
+        self._image_future = None
+        try:
+            image = future.result()
+        except Exception as e:
+            logging.error(f"Error loading image: {e}")
+            self.current_image_display.configure(
+                text=f"Error loading image: {str(e)}",
+                foreground="red"
+            )
+            return
+            
+        # PhotoImage must be created on the Tk main thread
+        from PIL import ImageTk
+        photo = ImageTk.PhotoImage(image)
+        self.current_image_display.configure(image=photo, text="")
+        self.current_image_display.image = photo  # Keep a reference
+        
+        if self.photo_cache is not None:
+            self.photo_cache[self._photo_key] = photo
+            while len(self.photo_cache) > PHOTO_CACHE_SIZE:
+                self.photo_cache.popitem(last=False)
+        
     def _init_llm_chatbox(self, parent):
         """Initialize LLM chatbox UI"""
         # Create a frame for the chatbox
@@ -201,6 +315,22 @@ class EditOrderView(ttk.Frame):
         
         self._init_llm_chatbox_content(chat_frame)
         
+    def _init_llm_chatbox_placeholder(self, chat_frame):
+        """Show a button that builds the LLM chatbox on first use"""
+        self._chat_open_button = ttk.Button(
+            chat_frame,
+            text="Open AI Assistant",
+            command=partial(self._show_chatbox, chat_frame)
+        )
+        self._chat_open_button.pack(pady=10)
+        
+    def _show_chatbox(self, chat_frame):
+        """Build the LLM chatbox widgets the first time they are needed"""
+        if self.chat_history is not None:
+            return
+        self._chat_open_button.destroy()
+        self._init_llm_chatbox_content(chat_frame)
+        
     def _init_llm_chatbox_content(self, chat_frame):
         """Initialize the content of the LLM chatbox"""
         # Chat history display area
@@ -263,8 +393,13 @@ class EditOrderView(ttk.Frame):
         return "break"  # Prevent default behavior for Enter key
         
     def _update_chat_history(self, message):
-        """Update chat history with new message"""
+        """Update chat history with new message, keeping only the latest messages"""
         self.chat_history.configure(state=tk.NORMAL)
+        if len(self._chat_lines) == self._chat_lines.maxlen:
+            # Trim the oldest message (its text plus the blank separator line)
+            oldest = self._chat_lines[0]
+            self.chat_history.delete("1.0", f"{oldest.count(chr(10)) + 3}.0")
+        self._chat_lines.append(message)
         self.chat_history.insert(tk.END, message + "\n\n")
         self.chat_history.see(tk.END)  # Scroll to bottom
         self.chat_history.configure(state=tk.DISABLED)
@@ -297,23 +432,38 @@ class EditOrderView(ttk.Frame):
             foreground="red" if is_error else "blue"
         )
         # Clear status after 3 seconds
-        self.after(3000, lambda: self.status_label.configure(text=""))
+        self._schedule_status_clear()
+
+    def _schedule_status_clear(self):
+        """Clear the status label in 3 seconds, replacing any earlier schedule"""
+        if self._status_clear_after_id is not None:
+            self.after_cancel(self._status_clear_after_id)
+        self._status_clear_after_id = self.after(3000, self._clear_status)
+
+    def _clear_status(self):
+        """Clear the status label"""
+        self._status_clear_after_id = None
+        self.status_label.configure(text="")
+
+    def _collect_form_state(self):
+        """Read the status checkboxes and note from the form in one pass"""
+        state = {key: cb.instate(['selected']) for key, cb in self._checkboxes.items()}
+        # 'end-1c' excludes the trailing newline Tk always appends
+        state['note'] = self.note_area.get("1.0", "end-1c")
+        return state
 
     def _save_changes(self):
         """Save changes to the order"""
+        # This save covers any pending status change
+        if self._pending_save_id is not None:
+            self.after_cancel(self._pending_save_id)
+            self._pending_save_id = None
+            
         try:
+            order = self.order
+            
             # Create updated order object
-            updated_order = Order(
-                order_number=self.order.order_number,
-                amount=self.order.amount,
-                image_uri=self.order.image_uri,
-                comment_with_picture=self.status_vars['comment_with_picture'].get(),
-                commented=self.status_vars['commented'].get(),
-                revealed=self.status_vars['revealed'].get(),
-                reimbursed=self.status_vars['reimbursed'].get(),
-                reimbursed_amount=self.order.reimbursed_amount,
-                note=self.note_area.get("1.0", tk.END).strip()
-            )
+            updated_order = replace(order, **self._collect_form_state())
             
             # Update in database
             if self.viewmodel.update_order(self.order_id, updated_order):
@@ -322,7 +472,7 @@ class EditOrderView(ttk.Frame):
                     foreground="green"
                 )
                 # Close window after a short delay
-                self.after(500, self._handle_cancel)
+                self._close_after_id = self.after(500, self._handle_cancel)
             else:
                 self.status_label.config(
                     text="Failed to save changes",
@@ -337,54 +487,125 @@ class EditOrderView(ttk.Frame):
             
     def _handle_cancel(self):
         """Handle cancel button click"""
+        self.close()
+        
+    def close(self):
+        """Finish pending work for the current order and hand the window back to its owner"""
+        # Status changes are saved as they happen, so don't drop a pending one
+        self._flush_pending_save()
+        self._cancel_scheduled()
+            
+        # Free the Tk photo image while the window is hidden
+        self._release_image()
         if self.on_close:
             self.on_close()
 
+    def _cancel_scheduled(self):
+        """Cancel scheduled callbacks and image loads for the current order"""
+        for after_id in (self._pending_save_id, self._status_clear_after_id, self._close_after_id):
+            if after_id is not None:
+                self.after_cancel(after_id)
+        self._pending_save_id = None
+        self._status_clear_after_id = None
+        self._close_after_id = None
+            
+        # Stop any pending image load so it doesn't touch replaced widgets
+        if self._image_future is not None:
+            self._image_future.cancel()
+            self._image_future = None
+
+    def _release_image(self):
+        """Release the displayed photo image so Tk frees its pixmap right away"""
+        if self.current_image_display is None:
+            return
+        photo = getattr(self.current_image_display, 'image', None)
+        if photo is not None:
+            # Detach the image from the label, then drop the last reference;
+            # photos kept in the shared cache stay intact for the next open
+            self.current_image_display.configure(image='')
+            if self.photo_cache is None or self.photo_cache.get(self._photo_key) is not photo:
+                self.tk.call(str(photo), 'blank')
+            del self.current_image_display.image
+        self.current_image_display = None
+
     def _on_status_change(self, status: str):
         """
         Handle status checkbox changes
         
+        Saves are debounced so several toggles in a row result in a single
+        database write.
+        
         Args:
             status: The status that changed
         """
+        new_value = self._checkboxes[status].instate(['selected'])
+        logging.info(f"Status change - {status}: {new_value}")
+        
+        # Nothing to save if the value matches what is already stored
+        if getattr(self.order, status) == new_value:
+            return
+            
+        if self._pending_save_id is not None:
+            self.after_cancel(self._pending_save_id)
+        else:
+            # Remember the values from before this burst of changes so they can be restored
+            self._prev_status_values = {key: cb.instate(['selected']) for key, cb in self._checkboxes.items()}
+            self._prev_status_values[status] = not new_value
+            
+        self._pending_status = status
+        self._pending_save_id = self.after(300, self._do_coalesced_save, status)
+
+    def _flush_pending_save(self):
+        """Run a pending status save immediately"""
+        if self._pending_save_id is not None:
+            self.after_cancel(self._pending_save_id)
+            self._do_coalesced_save(self._pending_status)
+
+    def _revert_status_changes(self):
+        """Restore the checkboxes to their values before the last save attempt"""
+        for key, value in self._prev_status_values.items():
+            self._checkboxes[key].state(['selected' if value else '!selected'])
+
+    def _do_coalesced_save(self, status: str):
+        """
+        Save the current status values to the database
+        
+        Args:
+            status: The most recently changed status
+        """
+        self._pending_save_id = None
         try:
-            # Get the new value
-            new_value = self.status_vars[status].get()
-            logging.info(f"Status change - {status}: {new_value}")
+            order = self.order
             
             # Create updated order with new status
-            updated_order = Order(
-                order_number=self.order.order_number,
-                amount=self.order.amount,
-                image_uri=self.order.image_uri,
-                comment_with_picture=self.status_vars['comment_with_picture'].get(),
-                commented=self.status_vars['commented'].get(),
-                revealed=self.status_vars['revealed'].get(),
-                reimbursed=self.status_vars['reimbursed'].get(),
-                reimbursed_amount=self.order.reimbursed_amount,
-                note=self.note_area.get("1.0", tk.END).strip()
-            )
+            updated_order = replace(order, **self._collect_form_state())
+            
+            # Skip the write if the statuses ended up back at their stored values
+            if all(getattr(updated_order, key) == getattr(order, key) for key in _STATUS_LABELS):
+                return
             
             # Update in database
             if self.viewmodel.update_order(self.order_id, updated_order):
+                # Compare later changes against the saved values
+                self.order = updated_order
                 self.status_label.config(
-                    text=f"{status.replace('_', ' ').title()} status updated",
+                    text=f"{_STATUS_LABELS[status]} status updated",
                     foreground="green"
                 )
                 # Schedule status message to clear after 3 seconds
-                self.after(3000, lambda: self.status_label.config(text=""))
+                self._schedule_status_clear()
             else:
                 self.status_label.config(
                     text=f"Failed to update {status}",
                     foreground="red"
                 )
-                # Revert checkbox if update failed
-                self.status_vars[status].set(not new_value)
+                # Revert checkboxes if update failed
+                self._revert_status_changes()
         except Exception as e:
             logging.error(f"Error updating status: {e}")
             self.status_label.config(
                 text=f"Error: {str(e)}",
                 foreground="red"
             )
-            # Revert checkbox on error
-            self.status_vars[status].set(not new_value) 
\ No newline at end of file
+            # Revert checkboxes on error
+            self._revert_status_changes()
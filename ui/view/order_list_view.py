@@ -6,11 +6,28 @@ import sys
 import logging
 import platform
 import datetime
+import functools
+import bisect
+import math
+from array import array
+import threading
+import time
+from collections import OrderedDict
 from ui.viewmodel.order_list_viewmodel import OrderListViewModel
-from ui.view.edit_order_view import EditOrderView
-from ui.view.add_order_view import AddOrderView
-from typing import Callable, List
+from typing import Callable, List, Optional
+from model.order import Order
 
+# Evaluated once; platform.system() can spawn uname on some systems
+_SYSTEM = platform.system()
+_IS_MAC = _SYSTEM == "Darwin"
+
+# Modules used by dark mode detection on each platform
+if _IS_MAC:
+    import subprocess
+elif _SYSTEM == "Windows":
+    import winreg
+
+@functools.lru_cache(maxsize=None)
 def resource_path(relative_path):
     """Get absolute path to resource, works for dev and for PyInstaller"""
     try:
@@ -27,21 +44,33 @@ def resource_path(relative_path):
         logging.error(f"Error getting resource path: {e}")
         return relative_path
 
-def detect_dark_mode():
+# Last detect_dark_mode() result and when it was taken (time.monotonic)
+DARK_MODE_CACHE_SECONDS = 5.0
+_dark_mode_cache = {'value': None, 'checked_at': 0.0}
+
+def detect_dark_mode(use_cache=True):
+    """Return whether the system is in dark mode, reusing a recent result unless use_cache is False"""
+    now = time.monotonic()
+    if (use_cache and _dark_mode_cache['value'] is not None
+            and now - _dark_mode_cache['checked_at'] < DARK_MODE_CACHE_SECONDS):
+        return _dark_mode_cache['value']
+    value = _probe_dark_mode()
+    _dark_mode_cache.update(value=value, checked_at=now)
+    return value
+
+def _probe_dark_mode():
     """检测系统是否处于暗色模式"""
     try:
-        if platform.system() == "Darwin":  # macOS
-            import subprocess
+        if _IS_MAC:  # macOS
             result = subprocess.run(
                 ['defaults', 'read', '-g', 'AppleInterfaceStyle'],
                 capture_output=True, text=True
             )
             return result.stdout.strip() == "Dark"
-        elif platform.system() == "Windows":  # Windows
-            import winreg
-            registry = winreg.ConnectRegistry(None, winreg.HKEY_CURRENT_USER)
-            key = winreg.OpenKey(registry, r"Software\Microsoft\Windows\CurrentVersion\Themes\Personalize")
-            value, _ = winreg.QueryValueEx(key, "AppsUseLightTheme")
+        elif _SYSTEM == "Windows":  # Windows
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER,
+                                r"Software\Microsoft\Windows\CurrentVersion\Themes\Personalize") as key:
+                value, _ = winreg.QueryValueEx(key, "AppsUseLightTheme")
             return value == 0
         else:  # Linux 和其他系统，默认为光模式
             return False
@@ -49,6 +78,26 @@ def detect_dark_mode():
         logging.error(f"Error detecting dark mode: {e}")
         return False
 
+# Inserting more rows than this at once is done with the tree unpacked
+BATCH_UNPACK_THRESHOLD = 50
+
+# Shared tag tuples for every (completed, search match) combination
+_ROW_TAGS = {
+    (False, False): (),
+    (True, False): ('completed',),
+    (False, True): ('match',),
+    (True, True): ('completed', 'match'),
+}
+
+# Lists longer than this only insert the rows around the scroll position
+VIRTUAL_ROW_THRESHOLD = 500
+
+# Rows kept in the tree above and below the visible part of a virtualized list
+VIRTUAL_OVERSCAN_ROWS = 50
+
+# Orders shown at startup while the rest of the list is still loading
+FIRST_PAGE_SIZE = 100
+
 class OrderListView(ttk.Frame):
     def __init__(self, parent, viewmodel: OrderListViewModel, on_add_click: Callable):
         super().__init__(parent, padding=20)
@@ -56,22 +105,41 @@ class OrderListView(ttk.Frame):
         self.viewmodel = viewmodel
         self.on_add_click = on_add_click
         self.edit_window = None
+        self.edit_view = None  # EditOrderView inside edit_window, reused for each edit
+        self.photo_cache = OrderedDict()  # Edit view photos, reused when an order is reopened
         self.original_orders = []  # Store original orders for search filtering
-        
-        # 检测当前系统主题
-        self.is_dark_mode = detect_dark_mode()
+        self._search_after_id = None  # Pending debounced search
+        self._update_after_id = None  # Pending refresh after a data change
+        self._applied_query = None  # (search text, search type) currently displayed
+        self._search_type_value = "Order Number"  # Current search type; the combobox is readonly
+        self._toast = None  # Reusable non-modal notification label
+        self._toast_after_id = None  # Pending toast hide
+        self._row_state = {}  # Tree item id -> (values, tags) currently displayed
+        self._row_order = []  # Tree item ids in display order
+        self._by_id = {}  # Order id -> Order
+        self._showing_first_page = False  # Only the first page is shown while the full list loads
+        self._search_index = []  # (lowercased order number, amount, Order) for searching
+        self._last_number_search = None  # (search text, matching _search_index entries)
+        self._amount_keys = array('q')  # Order amounts in cents, ascending
+        self._trigram_index = {}  # 3-character substring of an order number -> _search_index positions
+        self._amount_positions = array('q')  # Position in original_orders for each entry of _amount_keys
+        self._all_rows = []  # (iid, values, tags) for every order being shown
+        self._virtual = False  # True when only a window of _all_rows is in the tree
+        self._window_start = 0  # Index in _all_rows of the first visible row
+        self._window_first = 0  # Index in _all_rows of the first row in the tree
+        
+        # 检测当前系统主题 (detected in the background; light until known)
+        self.is_dark_mode = bool(_dark_mode_cache['value'])
         self.colors = self._get_theme_colors()
         
         # 监听系统主题变化
-        if platform.system() == "Darwin":  # macOS
+        if _IS_MAC:  # macOS
             parent.bind("<<ThemeChanged>>", self._update_theme)
         
         self._init_ui()
+        self._detect_theme_async()
         self.viewmodel.set_data_changed_callback(self.update_ui)
-        self.viewmodel.load_orders()
-        
-        # Initialize search field as empty to show all orders
-        self.search_var.set("")
+        self._load_orders_async()
         
     def _get_theme_colors(self):
         """获取基于当前主题的颜色方案"""
@@ -98,11 +166,31 @@ class OrderListView(ttk.Frame):
     
     def _update_theme(self, event=None):
         """更新主题颜色"""
-        # 重新检测当前主题
-        self.is_dark_mode = detect_dark_mode()
+        # 重新检测当前主题 (the theme just changed, so skip the cached result)
+        self._detect_theme_async(use_cache=False)
+
+    def _detect_theme_async(self, use_cache=True):
+        """Detect the system theme off the Tk main thread, then apply it"""
+        def _detect():
+            is_dark_mode = detect_dark_mode(use_cache)
+            self.after(0, self._apply_theme, is_dark_mode)
+        threading.Thread(target=_detect, daemon=True).start()
+
+    def _apply_theme(self, is_dark_mode):
+        """Restyle the list if the detected theme differs from the current one"""
+        if is_dark_mode == self.is_dark_mode or not self.winfo_exists():
+            return
+        self.is_dark_mode = is_dark_mode
         self.colors = self._get_theme_colors()
         
         # 更新样式
+        self._apply_tag_styles()
+        
+        if self._toast is not None:
+            self._toast.configure(bg=self.colors['selection_bg'], fg=self.colors['selection_fg'])
+
+    def _apply_tag_styles(self):
+        """Configure selection and tag colors for the current theme"""
         style = ttk.Style()
         
         # 配置选中项颜色
@@ -119,8 +207,13 @@ class OrderListView(ttk.Frame):
                                background=self.colors['match_bg'], 
                                foreground=self.colors['match_fg'])
         
-        # 重绘UI
-        self.update_ui()
+        # Override text color for tagged items even when not focused
+        style.map('completed.Treeview.Item', foreground=[('!focus', self.colors['completed_fg'])])
+        style.map('match.Treeview.Item', foreground=[('!focus', self.colors['match_fg'])])
+        
+        # Remember the row height so scrolling doesn't have to query the style
+        row_height = style.lookup('Treeview', 'rowheight')
+        self._row_height = int(row_height) if row_height else 20
 
     def _init_ui(self):
         """Initialize the UI components"""
@@ -157,7 +250,7 @@ class OrderListView(ttk.Frame):
         
         # Search entry
         self.search_var = tk.StringVar()
-        self.search_var.trace("w", self._on_search_change)
+        self.search_var.trace_add("write", self._on_search_change)
         search_entry = ttk.Entry(
             search_frame,
             textvariable=self.search_var,
@@ -174,7 +267,7 @@ class OrderListView(ttk.Frame):
         )
         self.search_type.set("Order Number")
         self.search_type.pack(side=tk.LEFT, padx=5)
-        self.search_type.bind("<<ComboboxSelected>>", lambda e: self._on_search_change())
+        self.search_type.bind("<<ComboboxSelected>>", self._on_search_type_change)
         
         # Add Order button
         add_button = ttk.Button(
@@ -184,14 +277,6 @@ class OrderListView(ttk.Frame):
         )
         add_button.pack(side=tk.RIGHT)
         
-        # Create custom style before creating Treeview
-        style = ttk.Style()
-        
-        # Configure selection colors 
-        style.map('Treeview', 
-                 foreground=[('selected', self.colors['selection_fg'])],
-                 background=[('selected', self.colors['selection_bg'])])
-        
         # Create Treeview
         columns = (
             "ID", 
@@ -226,30 +311,20 @@ class OrderListView(ttk.Frame):
         self.tree.column("Revealed", width=100)
         self.tree.column("Reimbursed", width=100)
         
-        # Configure tags for special styling
-        self.tree.tag_configure('completed', 
-                               background=self.colors['completed_bg'], 
-                               foreground=self.colors['completed_fg'])
-        
-        self.tree.tag_configure('match', 
-                               background=self.colors['match_bg'], 
-                               foreground=self.colors['match_fg'])
-        
-        # Override text color for tagged items even when not focused
-        style.map('completed.Treeview.Item', foreground=[('!focus', self.colors['completed_fg'])])
-        style.map('match.Treeview.Item', foreground=[('!focus', self.colors['match_fg'])])
+        # Configure selection and tag colors
+        self._apply_tag_styles()
         
         # Add event handler for window focus changes to reapply tag styling
         self.parent.bind("<FocusIn>", self._on_focus_change)
         self.parent.bind("<FocusOut>", self._on_focus_change)
         
         # Add scrollbar
-        scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.tree.yview)
-        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self.tree.configure(yscrollcommand=self._on_tree_yscroll)
         
         # Pack tree and scrollbar
-        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self._pack_tree()
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         # Create right-click menu
         self.context_menu = tk.Menu(self, tearoff=0)
@@ -259,7 +334,7 @@ class OrderListView(ttk.Frame):
         self.context_menu.add_command(label="Delete Selected", command=self._delete_selected_orders)
         
         # Bind events
-        if platform.system() == "Darwin":  # macOS
+        if _IS_MAC:  # macOS
             self.tree.bind("<Button-2>", self._show_context_menu)  # Right click
             self.tree.bind("<Control-Button-1>", self._show_context_menu)  # Control+click
         else:  # Windows/Linux
@@ -267,6 +342,12 @@ class OrderListView(ttk.Frame):
             
         self.tree.bind("<Button-1>", self._handle_click)  # Left click
         self.tree.bind("<Double-Button-1>", self._handle_double_click)  # Double click
+        
+        # Mouse wheel scrolling has to move the row window when the list is virtualized
+        self.tree.bind("<MouseWheel>", self._on_mousewheel)
+        self.tree.bind("<Button-4>", self._on_mousewheel)
+        self.tree.bind("<Button-5>", self._on_mousewheel)
+        self.tree.bind("<Configure>", self._on_tree_configure)
 
     def _show_context_menu(self, event):
         """Show the context menu on right click"""
@@ -299,24 +380,75 @@ class OrderListView(ttk.Frame):
 
     def _handle_click(self, event):
         """Handle left click events"""
-        # Get the clicked item and column
+        # Only clicks on the Order Number column copy anything, so check the
+        # column before looking up the row
+        if self.tree.identify_column(event.x) != "#2":
+            return
         item = self.tree.identify_row(event.y)
-        column = self.tree.identify_column(event.x)
         
-        if item and column == "#2":  # Order Number column
-            # Get the order number value
-            order_number = self.tree.item(item)["values"][1]  # Index 1 for Order Number
+        if item:
+            # Get the order number from the cached index (tree values can turn numeric text into ints)
+            order = self._by_id.get(int(item))
+            if not order:
+                return
             # Copy to clipboard
             self.clipboard_clear()
-            self.clipboard_append(order_number)
+            self.clipboard_append(order.order_number)
+            
+            # Confirm without a modal dialog so the list stays responsive
+            self._show_toast("Order number copied to clipboard")
+
+    def _show_toast(self, message: str, duration: int = 1500):
+        """Briefly show a non-modal message over the top of the list for duration ms"""
+        if self._toast is None:
+            self._toast = tk.Label(
+                self,
+                bg=self.colors['selection_bg'],
+                fg=self.colors['selection_fg'],
+                padx=12,
+                pady=4
+            )
+        self._toast.configure(text=message)
+        self._toast.place(relx=0.5, rely=0.05, anchor='n')
+        self._toast.lift()
+        
+        # Restart the timer if a toast is already showing
+        if self._toast_after_id is not None:
+            self.after_cancel(self._toast_after_id)
+        self._toast_after_id = self.after(duration, self._hide_toast)
+
+    def _hide_toast(self):
+        """Hide the toast message"""
+        self._toast_after_id = None
+        if self._toast is not None:
+            self._toast.place_forget()
+
+    def _orders_still_loading(self) -> bool:
+        """Tell the user to wait if only the first page of orders is loaded"""
+        # Changes made now would be based on a partial list and undone by the full load
+        if self._showing_first_page:
+            self._show_toast("Orders are still loading")
+        return self._showing_first_page
+
+    def _resolve_selected_order(self) -> Optional[Order]:
+        """Return the order for the first selected row, or None if there isn't one"""
+        selected_items = self.tree.selection()
+        if not selected_items or self._orders_still_loading():
+            return None
             
-            # Show notification
-            self._show_message("Order number copied to clipboard", "Notification", "info")
+        # Tree item iids are the database ids; look them up in the cached index
+        order_id = int(selected_items[0])
+        order = self._by_id.get(order_id)
+        if not order:
+            error_msg = f"Order ID {order_id} not found in database"
+            logging.error(error_msg)
+            messagebox.showerror("Error", error_msg)
+        return order
 
     def _delete_single_order(self):
         """Delete a single selected order (via right-click)"""
         selected_items = self.tree.selection()
-        if not selected_items:
+        if not selected_items or self._orders_still_loading():
             return
             
         # If multiple items are selected but user chose "Delete" (not "Delete Selected"),
@@ -339,19 +471,11 @@ class OrderListView(ttk.Frame):
             # If No was clicked, continue with deleting just the one item
             
         try:
-            # Get the actual order_id from the tree item's iid
-            order_id = int(selected_items[0])  # selected_items[0] is the iid we set earlier
-            logging.info(f"Deleting order - Selected Tree IID: {selected_items[0]}, Parsed Database ID: {order_id}")
-            
-            # Get order data using order ID directly
-            order = self.viewmodel.get_order_by_id(order_id)
+            order = self._resolve_selected_order()
             if not order:
-                error_msg = f"Order ID {order_id} not found in database"
-                logging.error(error_msg)
-                messagebox.showerror("Error", error_msg)
                 return
-                
-            logging.info(f"Retrieved order for deletion - Database ID: {order.id}, Order Number: {order.order_number}")
+            order_id = order.id
+            logging.info("Retrieved order for deletion - Database ID: %s, Order Number: %s", order.id, order.order_number)
             
             # Create confirmation dialog
             confirm = messagebox.askyesno(
@@ -362,10 +486,10 @@ class OrderListView(ttk.Frame):
             if confirm:
                 # Delete the order
                 if self.viewmodel.delete_order(order_id):
-                    logging.info(f"Successfully deleted order - Database ID: {order_id}, Order Number: {order.order_number}")
-                    self._show_message(f"Order #{order.order_number} successfully deleted", "Success", "info")
+                    logging.info("Successfully deleted order - Database ID: %s, Order Number: %s", order_id, order.order_number)
+                    self._show_toast(f"Order #{order.order_number} deleted", 2000)
                 else:
-                    logging.error(f"Failed to delete order - Database ID: {order_id}, Order Number: {order.order_number}")
+                    logging.error("Failed to delete order - Database ID: %s, Order Number: %s", order_id, order.order_number)
                     self._show_message(f"Failed to delete order #{order.order_number}", "Error", "error")
         except Exception as e:
             logging.error(f"Error in _delete_single_order: {e}", exc_info=True)
@@ -375,6 +499,8 @@ class OrderListView(ttk.Frame):
         """Delete all selected orders"""
         # Get all selected orders
         selected_items = self.tree.selection()
+        if self._orders_still_loading():
+            return
         
         # Check if any orders are selected
         if not selected_items:
@@ -385,7 +511,7 @@ class OrderListView(ttk.Frame):
         selected_orders = []
         for item_id in selected_items:
             order_id = int(item_id)  # Convert item_id to order_id
-            order = self.viewmodel.get_order_by_id(order_id)
+            order = self._by_id.get(order_id)
             if order:
                 selected_orders.append(order)
         
@@ -398,15 +524,10 @@ class OrderListView(ttk.Frame):
         if not confirm:
             return
             
-        # Delete orders
-        success_count = 0
-        failed_orders = []
-        
-        for order in selected_orders:
-            if self.viewmodel.delete_order(order.id):
-                success_count += 1
-            else:
-                failed_orders.append(order.order_number)
+        # Delete orders in a single batch
+        failed_ids = self.viewmodel.delete_orders([order.id for order in selected_orders])
+        failed_orders = [order.order_number for order in selected_orders if order.id in failed_ids]
+        success_count = len(selected_orders) - len(failed_orders)
                 
         # Show results
         if failed_orders:
@@ -416,182 +537,431 @@ class OrderListView(ttk.Frame):
                 "warning"
             )
         else:
-            self._show_message(
-                f"Successfully deleted {success_count} orders",
-                "Success",
-                "info"
-            )
+            # Success needs no acknowledgement, so don't block on a dialog
+            self._show_toast(f"Deleted {success_count} orders", 2000)
 
     def _edit_selected_order(self):
         """Edit the selected order"""
-        selected_items = self.tree.selection()
-        if not selected_items:
-            return
-        
         try:
-            # Get the actual order_id from the tree item's iid
-            order_id = int(selected_items[0])  # selected_items[0] is the iid we set earlier
-            logging.info(f"Editing order - Selected Tree IID: {selected_items[0]}, Parsed Database ID: {order_id}")
-            
-            # Get order data using order ID directly
-            order = self.viewmodel.get_order_by_id(order_id)
+            order = self._resolve_selected_order()
             if not order:
-                error_msg = f"Order ID {order_id} not found in database"
-                logging.error(error_msg)
-                messagebox.showerror("Error", error_msg)
                 return
-                
-            logging.info(f"Retrieved order for editing - Database ID: {order.id}, Order Number: {order.order_number}")
-            
-            # If we already have an edit window open, close it
-            if hasattr(self, 'edit_window') and self.edit_window:
-                self.edit_window.destroy()
+            order_id = order.id
+            logging.info("Retrieved order for editing - Database ID: %s, Order Number: %s", order.id, order.order_number)
             
-            # Create a new window for editing
-            self.edit_window = tk.Toplevel(self.parent)
-            self.edit_window.title(f"Edit Order #{order.order_number}")  # Use order number for title
-            self.edit_window.geometry("800x600")
-            
-            # Make it modal
-            self.edit_window.transient(self.parent)
-            
-            # Withdraw the window until it's positioned
-            self.edit_window.withdraw()
-            
-            # Calculate center position
-            screen_width = self.winfo_screenwidth()
-            screen_height = self.winfo_screenheight()
-            x = (screen_width - 800) // 2
-            y = (screen_height - 600) // 2
-            self.edit_window.geometry(f"800x600+{x}+{y}")
-            
-            # Create edit view
-            try:
-                EditOrderView(
-                    self.edit_window,
-                    self.viewmodel,
-                    order_id,  # Pass the actual order_id
-                    self._on_edit_window_close
-                )
-                logging.info(f"Created EditOrderView for order - Database ID: {order_id}, Order Number: {order.order_number}")
+            # Build the edit window once, then hide it on close and reuse it for later edits
+            if self.edit_window is not None and self.edit_window.winfo_exists():
+                try:
+                    self.edit_view.load(order_id)
+                except Exception as e:
+                    logging.error(f"Failed to load order into EditOrderView: {e}", exc_info=True)
+                    messagebox.showerror("Error", f"Failed to open edit window: {str(e)}")
+                    return
+            else:
+                # Create a new window for editing
+                self.edit_window = tk.Toplevel(self.parent)
+                self.edit_window.geometry("800x600")
                 
-                # Make window modal
-                self.edit_window.grab_set()
+                # Make it modal
+                self.edit_window.transient(self.parent)
                 
-                # Show the window in its final position
-                self.edit_window.deiconify()
-            except Exception as e:
-                logging.error(f"Failed to create EditOrderView: {e}", exc_info=True)
-                messagebox.showerror("Error", f"Failed to open edit window: {str(e)}")
-                if self.edit_window:
+                # Withdraw the window until it's positioned
+                self.edit_window.withdraw()
+                
+                # Calculate center position
+                screen_width = self.winfo_screenwidth()
+                screen_height = self.winfo_screenheight()
+                x = (screen_width - 800) // 2
+                y = (screen_height - 600) // 2
+                self.edit_window.geometry(f"800x600+{x}+{y}")
+                
+                # Create edit view (imported on first use to keep startup light)
+                try:
+                    from ui.view.edit_order_view import EditOrderView
+                    self.edit_view = EditOrderView(
+                        self.edit_window,
+                        self.viewmodel,
+                        order_id,  # Pass the actual order_id
+                        self._on_edit_window_close,
+                        photo_cache=self.photo_cache
+                    )
+                    logging.info("Created EditOrderView for order - Database ID: %s, Order Number: %s", order_id, order.order_number)
+                except Exception as e:
+                    logging.error(f"Failed to create EditOrderView: {e}", exc_info=True)
+                    messagebox.showerror("Error", f"Failed to open edit window: {str(e)}")
                     self.edit_window.destroy()
                     self.edit_window = None
+                    self.edit_view = None
+                    return
+                    
+                # Closing from the title bar hides the window like Cancel does
+                self.edit_window.protocol("WM_DELETE_WINDOW", self.edit_view.close)
+                
+            self.edit_window.title(f"Edit Order #{order.order_number}")  # Use order number for title
+            
+            # Show the window in its final position and make it modal
+            self.edit_window.deiconify()
+            self.edit_window.grab_set()
         except Exception as e:
             logging.error(f"Error in _edit_selected_order: {e}", exc_info=True)
             messagebox.showerror("Error", f"An error occurred: {str(e)}")
 
     def _on_edit_window_close(self):
-        """Handle edit window closing"""
+        """Handle edit window closing by hiding it for reuse"""
         if self.edit_window:
             self.edit_window.grab_release()
-            self.edit_window.destroy()
+            self.edit_window.withdraw()
+
+    def destroy(self):
+        """Cancel pending callbacks before the widgets go away"""
+        for after_id in (self._search_after_id, self._toast_after_id, self._update_after_id):
+            if after_id:
+                self.after_cancel(after_id)
+        self._search_after_id = None
+        self._update_after_id = None
+        self._toast_after_id = None
+        # The edit window belongs to the root, so it would outlive this view
+        if self.edit_window is not None:
+            if self.edit_window.winfo_exists():
+                # Save any pending change and stop the edit view's callbacks first
+                self.edit_view.close()
+                self.edit_window.destroy()
             self.edit_window = None
+            self.edit_view = None
+        super().destroy()
 
     def _on_search_change(self, *args):
-        """Handle search input changes"""
+        """Handle search input changes by scheduling a single search per burst of typing"""
+        # Ignore events that leave the query as it was last applied
+        if (self.search_var.get().strip().lower(), self._search_type_value) == self._applied_query:
+            if self._search_after_id:
+                self.after_cancel(self._search_after_id)
+                self._search_after_id = None
+            return
+        if self._search_after_id:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(150, self._apply_search)
+
+    def _on_search_type_change(self, event=None):
+        """Remember the selected search type so searches don't have to read it from Tk"""
+        self._search_type_value = self.search_type.get()
+        self._on_search_change()
+
+    def _apply_search(self):
+        """Filter the order list using the current search text and type"""
+        self._search_after_id = None
         search_text = self.search_var.get().strip().lower()
-        search_type = self.search_type.get()
+        search_type = self._search_type_value
+        self._applied_query = (search_text, search_type)
         
         if not search_text:
             # If search is empty, show all orders
-            self._display_orders(self.original_orders)
+            self._display_orders(self.original_orders, total_amount=self.viewmodel.total_amount)
             return
         
-        # Filter orders based on search text
-        filtered_orders = []
-        for order in self.original_orders:
-            if search_type == "Order Number" and search_text in str(order.order_number).lower():
-                filtered_orders.append(order)
-            elif search_type == "Amount":
-                try:
-                    search_amount = float(search_text)
-                    if abs(search_amount - order.amount) <= 2:  # Allow small differences
-                        filtered_orders.append(order)
-                except ValueError:
-                    pass
+        # Filter orders based on search text, totalling the matches from the index as we go
+        total_amount = 0.0
+        if search_type == "Order Number":
+            # A query containing the previous one can only match a subset of its results
+            if self._last_number_search and self._last_number_search[0] in search_text:
+                candidates = self._last_number_search[1]
+            elif len(search_text) >= 3:
+                candidates = self._trigram_candidates(search_text)
+            else:
+                candidates = self._search_index
+            matches = [entry for entry in candidates if search_text in entry[0]]
+            self._last_number_search = (search_text, matches)
+            filtered_orders = [order for _, _, order in matches]
+            total_amount = sum(amount for _, amount, _ in matches)
+        elif search_type == "Amount":
+            # Parse the amount once; non-numeric input (including nan/inf) matches nothing
+            try:
+                search_amount = float(search_text)
+            except ValueError:
+                search_amount = None
+            if search_amount is not None and not math.isfinite(search_amount):
+                search_amount = None
+            if search_amount is None:
+                filtered_orders = []
+            else:
+                # Binary search the sorted cents for the +/-$2 window (allow small differences),
+                # then restore the list order
+                target = round(search_amount * 100)
+                low = bisect.bisect_left(self._amount_keys, target - 200)
+                high = bisect.bisect_right(self._amount_keys, target + 200)
+                filtered_orders = [
+                    self.original_orders[position]
+                    for position in sorted(self._amount_positions[low:high])
+                ]
+                total_amount = sum(self._amount_keys[low:high]) / 100
+        else:
+            filtered_orders = []
         
         # Display filtered orders
-        self._display_orders(filtered_orders, True)  # True for highlight matches
+        self._display_orders(filtered_orders, True, total_amount)  # True for highlight matches
 
-    def _display_orders(self, orders=None, highlight_search=False):
-        """Display orders in the treeview"""
-        # Clear the treeview
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-            
+    def _display_orders(self, orders=None, highlight_search=False, total_amount=None):
+        """Display orders in the treeview, only touching rows that changed"""
         # Use provided orders or current orders
         if orders is None:
             orders = self.viewmodel.orders
+            total_amount = self.viewmodel.total_amount
             
         # Update original_orders for search filtering if not already set
         if not self.original_orders:
             self.original_orders = self.viewmodel.orders
+            self._rebuild_indexes()
             
-        # Calculate total amount
-        total_amount = sum(order.amount for order in orders)
+        # Callers usually know the total already; only sum when they don't
+        if total_amount is None:
+            total_amount = sum(order.amount for order in orders)
             
         # Update total amount label
         self.total_amount_label.configure(text=f"Total Amount: ${total_amount:.2f}")
             
-        # Add orders to treeview
-        for index, order in enumerate(orders, 1):  # Start enumeration from 1
-            # Determine if order should be highlighted
-            tags = ()
-            if order.commented and order.revealed and order.reimbursed:
-                tags = ('completed',)  # Use 'completed' tag for styling
+        # 'completed' styles fully processed orders, 'match' highlights search results;
+        # the search flag is the same for every row, so resolve it once
+        completed_tags = _ROW_TAGS[True, bool(highlight_search)]
+        plain_tags = _ROW_TAGS[False, bool(highlight_search)]
+        
+        # Build the desired rows: order.id as the tree item identifier, then a
+        # sequential index starting from 1 and the cached display strings
+        rows = [
+            (str(order.id), (index, *order.row_values), completed_tags if order.is_completed else plain_tags)
+            for index, order in enumerate(orders, 1)
+        ]
+            
+        # Large lists only keep a window of rows in the tree
+        self._all_rows = rows
+        self._virtual = len(rows) > VIRTUAL_ROW_THRESHOLD
+        if self._virtual:
+            self._render_window()
+        else:
+            self._window_start = 0
+            self._window_first = 0
+            self._render_rows(rows)
+
+    def _render_rows(self, rows):
+        """Make the tree show exactly the given rows, only touching rows that changed"""
+        # Remove rows that are no longer shown
+        new_iids = [iid for iid, _, _ in rows]
+        new_iid_set = set(new_iids)
+        removed = [iid for iid in self._row_order if iid not in new_iid_set]
+        if removed:
+            self.tree.delete(*removed)
+            for iid in removed:
+                del self._row_state[iid]
                 
-            # Add 'match' tag if search is active and should highlight
-            if highlight_search:
-                tags = tags + ('match',)
+        # Take the tree out of the layout while inserting a large batch so Tk
+        # lays it out once when it is packed again, not once per row (a
+        # virtualized window is small, and unpacking while scrolling flickers),
+        # and leave the scrollbar alone until the batch is done
+        insert_count = sum(1 for iid in new_iids if iid not in self._row_state)
+        large_batch = insert_count > BATCH_UNPACK_THRESHOLD
+        unpacked = large_batch and not self._virtual
+        if unpacked:
+            self.tree.pack_forget()
+        if large_batch:
+            # Restore the already-registered Tcl command afterwards rather than re-registering it
+            yscrollcommand = self.tree.cget('yscrollcommand')
+            self.tree.configure(yscrollcommand='')
+        try:
+            # Insert new rows and update rows whose content changed
+            current_order = [iid for iid in self._row_order if iid in new_iid_set]
+            row_state = self._row_state
+            insert = self.tree.insert
+            for iid, values, tags in rows:
+                state = row_state.get(iid)
+                if state is None:
+                    insert("", tk.END, iid=iid, values=values, tags=tags)
+                    current_order.append(iid)
+                elif state != (values, tags):
+                    self.tree.item(iid, values=values, tags=tags)
+                row_state[iid] = (values, tags)
                 
-            # Format values for display
-            comment_status = "Yes" if order.comment_with_picture else "No"
-            commented_status = "Yes" if order.commented else "No"
-            revealed_status = "Yes" if order.revealed else "No"
-            reimbursed_status = "Yes" if order.reimbursed else "No"
+            # Fix up row order only if it changed, in a single Tcl call
+            if current_order != new_iids:
+                self.tree.set_children("", *new_iids)
+        finally:
+            if large_batch:
+                self.tree.configure(yscrollcommand=yscrollcommand)
+            if unpacked:
+                self._pack_tree()
+        self._row_order = new_iids
+
+    def _visible_row_count(self):
+        """Number of rows that fit in the tree at its current size"""
+        return max(int(self.tree.cget('height')), self.tree.winfo_height() // self._row_height)
+
+    def _render_window(self):
+        """Show the window of rows starting at _window_start and update the scrollbar"""
+        total = len(self._all_rows)
+        visible = self._visible_row_count()
+        start = max(0, min(self._window_start, total - visible))
+        self._window_start = start
+        
+        # Keep spare rows on both sides so small scrolls and keyboard moves stay inside the tree
+        first = max(0, start - VIRTUAL_OVERSCAN_ROWS)
+        window = self._all_rows[first:start + visible + VIRTUAL_OVERSCAN_ROWS]
+        self._window_first = first
+        self._render_rows(window)
+        self.tree.yview_moveto((start - first) / len(window))
+        self.scrollbar.set(start / total, min(1.0, (start + visible) / total))
+
+    def _on_tree_yscroll(self, first, last):
+        """Forward the tree's own scroll position to the scrollbar, mapped to the full list when virtualized"""
+        if not self._virtual:
+            self.scrollbar.set(first, last)
+            return
             
-            # Add row
-            self.tree.insert(
-                "",
-                tk.END,
-                iid=str(order.id),  # Use order.id as the tree item identifier
-                values=(
-                    index,  # Sequential ID starting from 1
-                    order.order_number,
-                    f"${order.amount:.2f}",
-                    order.note or "",
-                    comment_status,
-                    commented_status,
-                    revealed_status,
-                    reimbursed_status
-                ),
-                tags=tags
-            )
+        # The tree scrolls within its window on its own (arrow keys, selection),
+        # so translate its position into a row index in the full list
+        total = len(self._all_rows)
+        window_size = len(self._row_order)
+        visible = self._visible_row_count()
+        start = self._window_first + int(float(first) * window_size + 0.5)
+        self._window_start = start
+        self.scrollbar.set(start / total, min(1.0, (start + visible) / total))
+        
+        # Slide the window before the view runs out of spare rows on either side
+        margin = VIRTUAL_OVERSCAN_ROWS // 2
+        window_end = self._window_first + window_size
+        if ((self._window_first > 0 and start - self._window_first < margin) or
+                (window_end < total and window_end - (start + visible) < margin)):
+            self._render_window()
+
+    def _on_scrollbar(self, *args):
+        """Scroll the tree, or move the row window when the list is virtualized"""
+        if not self._virtual:
+            self.tree.yview(*args)
+            return
+            
+        if args[0] == 'moveto':
+            self._window_start = int(float(args[1]) * len(self._all_rows))
+        elif args[0] == 'scroll':
+            count = int(args[1])
+            if args[2] == 'pages':
+                count *= self._visible_row_count()
+            self._window_start += count
+        self._render_window()
+
+    def _on_tree_configure(self, event):
+        """Refill the row window when the tree is resized"""
+        if self._virtual:
+            self._render_window()
+
+    def _on_mousewheel(self, event):
+        """Move the row window with the mouse wheel when the list is virtualized"""
+        if not self._virtual:
+            return None
+            
+        # Button-4/5 on X11, signed delta on Windows and macOS
+        if event.num == 4 or getattr(event, 'delta', 0) > 0:
+            self._window_start -= 3
+        else:
+            self._window_start += 3
+        self._render_window()
+        return "break"
+
+    def _pack_tree(self):
+        """Pack the tree to the left of the scrollbar"""
+        if self.scrollbar.winfo_manager():
+            self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, before=self.scrollbar)
+        else:
+            self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
     def update_ui(self):
+        """Refresh the UI on the next idle tick, once per burst of data changes"""
+        if self._update_after_id is None:
+            self._update_after_id = self.after_idle(self._do_update_ui)
+
+    def _do_update_ui(self):
         """Update the UI with current data"""
-        # Update original_orders with latest data from viewmodel
+        self._update_after_id = None
+        # The list may have been replaced by another screen since the change
+        if not self.winfo_exists():
+            return
+        # Update original_orders with latest data from viewmodel; the full list is
+        # loaded now, so row actions no longer need to wait
+        self._showing_first_page = False
         self.original_orders = self.viewmodel.orders
+        self._rebuild_indexes()
         
-        # Get current search text
-        search_text = self.search_var.get().strip().lower()
+        # Redisplay right away with the current search (or all orders if it's empty);
+        # a pending debounced search would only repeat the same work
+        if self._search_after_id:
+            self.after_cancel(self._search_after_id)
+        self._apply_search()
+
+    def _rebuild_indexes(self):
+        """Rebuild the lookup and search indexes from original_orders"""
+        self._by_id = {order.id: order for order in self.original_orders}
+        self._last_number_search = None
+        # Positions of original_orders sorted by amount in cents, for exact range queries;
+        # kept as packed integer arrays rather than lists of int objects
+        cents = [order.amount_cents for order in self.original_orders]
+        self._amount_positions = array('q', sorted(range(len(cents)), key=cents.__getitem__))
+        self._amount_keys = array('q', [cents[position] for position in self._amount_positions])
+        self._search_index = [
+            (order.order_number_lower, order.amount, order)
+            for order in self.original_orders
+        ]
+        self._trigram_index = {}
+        for position, (order_number_lower, _, _) in enumerate(self._search_index):
+            for start in range(len(order_number_lower) - 2):
+                self._trigram_index.setdefault(order_number_lower[start:start + 3], set()).add(position)
+
+    def _trigram_candidates(self, search_text):
+        """Return the _search_index entries containing every 3-character piece of search_text"""
+        trigrams = {search_text[start:start + 3] for start in range(len(search_text) - 2)}
+        # Intersect starting from the rarest trigram to keep the working set small
+        position_sets = sorted((self._trigram_index.get(trigram, set()) for trigram in trigrams), key=len)
+        positions = position_sets[0].intersection(*position_sets[1:])
+        return [self._search_index[position] for position in sorted(positions)]
+
+    def _load_orders_async(self):
+        """Read the orders in a background thread and show them on the Tk main thread"""
+        self.total_amount_label.configure(text="Loading orders...")
         
-        # If search is empty, show all orders
-        if not search_text:
-            self._display_orders(self.viewmodel.orders)
-        else:
-            # Re-apply search filter
-            self._on_search_change()
+        def _load():
+            try:
+                orders = self.viewmodel.fetch_orders_page(0, FIRST_PAGE_SIZE)
+                if len(orders) == FIRST_PAGE_SIZE:
+                    # Show the top of the list while the remaining rows are read
+                    self.after(0, self._on_first_page_loaded, orders)
+                    orders = self.viewmodel.fetch_orders()
+            except Exception as e:
+                logging.error(f"Error loading orders: {e}")
+                orders = None
+            self.after(0, self._on_orders_loaded, orders)
+            
+        threading.Thread(target=_load, daemon=True).start()
+
+    def _on_first_page_loaded(self, orders):
+        """Show the first orders before the full list arrives (runs on the Tk main thread)"""
+        if not self.winfo_exists() or self.viewmodel.orders:
+            return
+        self._showing_first_page = True
+        # Index the shown rows so search and copying an order number work on them
+        self.original_orders = orders
+        self._rebuild_indexes()
+        self._display_orders(orders, total_amount=0.0)
+        # The total isn't known until every order is loaded
+        self.total_amount_label.configure(text="Loading orders...")
+
+    def _on_orders_loaded(self, orders):
+        """Hand loaded orders to the viewmodel (runs on the Tk main thread)"""
+        if not self.winfo_exists():
+            return
+        # Unlock the rows either way; a failed load shouldn't keep blocking edits
+        self._showing_first_page = False
+        if orders is None:
+            self.total_amount_label.configure(text="Failed to load orders")
+            return
+        self.viewmodel.set_orders(orders)
+        
+        # Build image thumbnails in the background so edit views open quickly
+        self.viewmodel.prewarm_thumbnails()
 
     def refresh(self):
         """Refresh the order list"""
@@ -611,9 +981,8 @@ class OrderListView(ttk.Frame):
 
     def _on_focus_change(self, event):
         """Handle window focus changes to maintain tag styling"""
-        # Reapply tag styling for all items with tags
-        for item_id in self.tree.get_children():
-            tags = self.tree.item(item_id, 'tags')
-            if 'completed' in tags or 'match' in tags:
-                # Force re-render by setting the same tags again
-                self.tree.item(item_id, tags=tags) 
\ No newline at end of file
+        # The binding sees focus events from every child widget; only react to the window itself
+        if event.widget is not self.parent or not self.winfo_exists():
+            return
+        # Tag styles apply to all tagged rows at once, no per-row work needed
+        self._apply_tag_styles()
\ No newline at end of file
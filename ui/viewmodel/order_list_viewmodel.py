@@ -1,17 +1,23 @@
 from db.database import Database, get_user_data_dir
 from model.order import Order
-from typing import List, Tuple, Optional, Callable
-from PIL import Image
+from typing import Dict, List, Tuple, Optional, Callable
 import os
 import sys
 import shutil
+import hashlib
 import threading
 import logging
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import replace
+from functools import partial
 
 # Lazy import pytesseract to improve startup speed
 pytesseract = None
 
+# Worker pool for OCR so images are processed off the Tk main thread
+_OCR_POOL = ThreadPoolExecutor(max_workers=2)
+
 def load_pytesseract():
     """Lazy load pytesseract only when needed"""
     global pytesseract
@@ -37,6 +43,73 @@ def load_pytesseract():
             return False
     return True
 
+# Longest side, in pixels, of images handed to Tesseract
+OCR_MAX_SIDE = 2000
+
+# OCR text shorter than this is retried on the unprocessed image
+OCR_MIN_TEXT_LENGTH = 10
+
+# Tesseract options: LSTM engine only, English, and no second pass over inverted
+# text (images are dark text on white). Page segmentation stays automatic since
+# order screenshots hold several blocks of text
+OCR_CONFIG = "--oem 1 -l eng -c tessedit_do_invert=0"
+
+# OCR cache files not read for this long are removed by the cache sweep
+OCR_CACHE_MAX_AGE = 30 * 24 * 60 * 60
+
+def flatten_to_rgb(image):
+    """Return an RGB copy of an image with any transparent areas composited onto white"""
+    from PIL import Image
+    # Palette and grayscale images can carry transparency without an alpha band
+    if 'transparency' in image.info and image.mode in ('P', 'L', 'RGB'):
+        image = image.convert('RGBA')
+    if image.mode in ('RGBA', 'LA', 'PA'):
+        # Paste the image on a white background, masked by just the alpha channel
+        background = Image.new('RGB', image.size, (255, 255, 255))
+        background.paste(image.convert('RGB'), mask=image.getchannel('A'))
+        return background
+    if image.mode != 'RGB':
+        return image.convert('RGB')
+    return image
+
+def _otsu_threshold(histogram: List[int]) -> int:
+    """Return the gray level that best splits a 256-bin histogram into dark and light pixels"""
+    total = sum(histogram)
+    weighted_total = sum(level * count for level, count in enumerate(histogram))
+    dark_count = 0
+    dark_sum = 0
+    best_level = 0
+    best_variance = 0.0
+    for level, count in enumerate(histogram):
+        dark_count += count
+        light_count = total - dark_count
+        if dark_count == 0:
+            continue
+        if light_count == 0:
+            break
+        dark_sum += level * count
+        mean_difference = dark_sum / dark_count - (weighted_total - dark_sum) / light_count
+        variance = dark_count * light_count * mean_difference * mean_difference
+        if variance > best_variance:
+            best_level = level
+            best_variance = variance
+    return best_level
+
+def _prepare_for_ocr(image):
+    """Downscale, grayscale and binarize an RGB image so Tesseract has fewer pixels to process"""
+    from PIL import Image
+    # Grayscale first so the resize touches one channel instead of three; bilinear
+    # is cheaper than Lanczos and binarization hides the difference
+    image = image.convert('L')
+    scale = OCR_MAX_SIDE / max(image.size)
+    if scale < 1:
+        image = image.resize(
+            (round(image.width * scale), round(image.height * scale)),
+            Image.Resampling.BILINEAR
+        )
+    threshold = _otsu_threshold(image.histogram())
+    return image.point(lambda level: 255 if level > threshold else 0, '1')
+
 def resource_path(relative_path):
     """Get absolute path to resource, works for dev and for PyInstaller"""
     try:
@@ -61,50 +134,101 @@ class OrderListViewModel:
     def __init__(self):
         self.db = Database()
         self._orders: List[Order] = []
+        self._orders_by_id: Dict[int, Order] = {}
+        self._total_amount = 0.0
         self._on_data_changed: Optional[Callable] = None
         self._current_image = None
         self._current_image_path = None
         self._comment_with_picture = False
         self._ocr_results = {}  # Cache for OCR results
-        self._ocr_callbacks = {}  # Callbacks for when OCR completes
+        self._ocr_futures: Dict[str, Future] = {}  # Image path -> OCR job still running
         self._ocr_lock = threading.Lock()
+        self.ocr_config = OCR_CONFIG  # Tesseract options, e.g. add "--psm 7" for a single line
+        self._thumbnails_prewarmed = False  # Thumbnails are prewarmed and swept once per session
         
         # Ensure images directory exists in user data directory
-        self.images_dir = os.path.join(get_user_data_dir(), 'images')
+        data_dir = get_user_data_dir()
+        self.images_dir = os.path.join(data_dir, 'images')
         os.makedirs(self.images_dir, exist_ok=True)
         
-        # Start background thread to preload pytesseract
-        threading.Thread(target=load_pytesseract, daemon=True).start()
+        # Cache directory for downscaled image thumbnails
+        self.thumbnails_dir = os.path.join(data_dir, 'thumbnails')
+        os.makedirs(self.thumbnails_dir, exist_ok=True)
+        
+        # Cache directory for OCR text, keyed by image content
+        self.ocr_cache_dir = os.path.join(data_dir, 'ocr_cache')
+        os.makedirs(self.ocr_cache_dir, exist_ok=True)
+
+    def preload_ocr(self):
+        """Load pytesseract in a background thread so the first OCR starts sooner"""
+        if pytesseract is None:
+            threading.Thread(target=self._warm_up_ocr, daemon=True).start()
+
+    def _warm_up_ocr(self):
+        """Load pytesseract and run Tesseract once on a blank image"""
+        if not load_pytesseract():
+            return
+        # The first run pays for reading the Tesseract binary, its libraries and the
+        # language data from disk; do it now so the first real image finds them cached
+        try:
+            from PIL import Image
+            pytesseract.image_to_string(Image.new('L', (8, 8), 255), config=self.ocr_config)
+        except Exception as e:
+            logging.warning(f"OCR warm-up failed: {e}")
 
     def load_orders(self):
         """Load orders from database"""
         try:
-            # Get orders from database and convert to Order objects
-            orders_data = self.db.get_all_orders()
-            self._orders = []
-            for order_data in orders_data:
-                order = Order(
-                    id=order_data[0],
-                    order_number=order_data[1],
-                    amount=order_data[2],
-                    image_uri=order_data[3],
-                    comment_with_picture=order_data[4],
-                    commented=order_data[5],
-                    revealed=order_data[6],
-                    reimbursed=order_data[7],
-                    reimbursed_amount=order_data[8],
-                    note=order_data[9]
-                )
-                self._orders.append(order)
-            self._notify_data_changed()
+            self.set_orders(self.fetch_orders())
         except Exception as e:
             logging.error(f"Error loading orders: {e}")
 
+    def fetch_orders(self) -> List[Order]:
+        """
+        Read all orders from the database without changing the current list
+        
+        Safe to call from a background thread; pass the result to set_orders
+        on the Tk main thread.
+        
+        Returns:
+            List[Order]: The orders in display order
+        """
+        # Get orders from database and convert to Order objects
+        orders_data = self.db.get_all_orders()
+        return [Order.from_row(order_data) for order_data in orders_data]
+
+    def fetch_orders_page(self, offset: int, limit: int) -> List[Order]:
+        """
+        Read one page of orders from the database without changing the current list
+        
+        Safe to call from a background thread.
+        
+        Args:
+            offset: Number of orders to skip
+            limit: Maximum number of orders to return
+            
+        Returns:
+            List[Order]: The orders in display order
+        """
+        return [Order.from_row(order_data) for order_data in self.db.get_orders_page(offset, limit)]
+
+    def set_orders(self, orders: List[Order]):
+        """Replace the current orders and notify observers"""
+        self._orders = orders
+        self._orders_by_id = {order.id: order for order in self._orders}
+        self._total_amount = sum(order.amount for order in self._orders)
+        self._notify_data_changed()
+
     @property
     def orders(self) -> List[Order]:
         """Get current orders"""
         return self._orders
 
+    @property
+    def total_amount(self) -> float:
+        """Get the sum of the current orders' amounts"""
+        return self._total_amount
+
     def set_data_changed_callback(self, callback: Callable):
         """Set callback for data changes"""
         self._on_data_changed = callback
@@ -130,7 +254,7 @@ class OrderListViewModel:
         """
         try:
             # Get the order before deleting (to get image path)
-            order = next((o for o in self._orders if o.id == order_id), None)
+            order = self._orders_by_id.get(order_id)
             
             # Delete from database
             if not self.db.remove_order(order_id):
@@ -138,20 +262,60 @@ class OrderListViewModel:
                 
             # If order had an image, delete it
             if order and order.image_uri:  # image_uri
-                try:
-                    if os.path.exists(order.image_uri):
-                        os.remove(order.image_uri)
-                except Exception as e:
-                    logging.error(f"Error deleting image file: {e}")
-            
-            # Refresh the orders list
-            self.load_orders()
+                self._remove_order_image(order.image_uri)
+            
+            # Drop the order from the list in memory instead of reloading every row
+            self.set_orders([order for order in self._orders if order.id != order_id])
             return True
             
         except Exception as e:
             logging.error(f"Error deleting order: {e}")
             return False
 
+    def delete_orders(self, order_ids: List[int]) -> List[int]:
+        """
+        Delete several orders from the database in a single transaction
+        
+        Args:
+            order_ids: The IDs of the orders to delete
+            
+        Returns:
+            List[int]: The IDs that could not be deleted
+        """
+        try:
+            deleted_ids = set(self.db.remove_orders(order_ids))
+        except Exception as e:
+            logging.error(f"Error deleting orders: {e}")
+            return list(order_ids)
+            
+        # Delete the images of the removed orders
+        for order_id in deleted_ids:
+            order = self._orders_by_id.get(order_id)
+            if order and order.image_uri:
+                self._remove_order_image(order.image_uri)
+                    
+        # Update the list once for the whole batch, without reloading every row
+        if deleted_ids:
+            self.set_orders([order for order in self._orders if order.id not in deleted_ids])
+        return [order_id for order_id in order_ids if order_id not in deleted_ids]
+
+    def _remove_order_image(self, image_path: str):
+        """
+        Delete an order's image together with its cached thumbnail
+        
+        Args:
+            image_path: Path to the stored order image
+        """
+        try:
+            if os.path.exists(image_path):
+                # The thumbnail key needs the image's mtime, so remove it first
+                thumbnail_path = self._thumbnail_path(image_path)
+                if os.path.exists(thumbnail_path):
+                    os.remove(thumbnail_path)
+                os.remove(image_path)
+        except Exception as e:
+            logging.error(f"Error deleting image file: {e}")
+
     def _copy_image_for_order(self, order_number: str, source_path: str) -> Optional[str]:
         """
         Copy image to images directory with order number as name
@@ -171,14 +335,104 @@ class OrderListViewModel:
             dest_filename = f"{order_number}{ext}"
             dest_path = os.path.join(self.images_dir, dest_filename)
             
-            # Copy the file
-            shutil.copy2(source_path, dest_path)
+            # Nothing to do if this image is already stored for the order
+            if os.path.exists(dest_path) and os.path.samefile(source_path, dest_path):
+                return dest_path
+                
+            # Copy just the bytes; copyfile skips the metadata syscalls of copy2
+            # and uses sendfile on Linux
+            shutil.copyfile(source_path, dest_path)
             
             return dest_path
         except Exception as e:
             logging.error(f"Error copying image: {e}")
             return None
 
+    def get_thumbnail_path(self, image_path: str, size: int = 400) -> Optional[str]:
+        """
+        Get a cached thumbnail for an image, creating it on first use
+        
+        Thumbnails are keyed by source path, modification time and size, so
+        an edited source image gets a fresh thumbnail.
+        
+        Args:
+            image_path: Path to the source image
+            size: Maximum width/height of the thumbnail
+            
+        Returns:
+            str: Path to the thumbnail file, or None if it could not be created
+        """
+        try:
+            thumbnail_path = self._thumbnail_path(image_path, size)
+            
+            if os.path.exists(thumbnail_path):
+                return thumbnail_path
+                
+            # PIL is only needed on a cache miss
+            from PIL import Image
+            image = Image.open(image_path)
+            # Let the JPEG decoder downscale before any pixel work
+            image.draft('RGB', (size * 2, size * 2))
+            # reducing_gap lets Pillow reduce() by an integer factor before Lanczos
+            image.thumbnail((size, size), Image.Resampling.LANCZOS, reducing_gap=3.0)
+            # JPEG has no alpha, so composite transparent screenshots onto white
+            image = flatten_to_rgb(image)
+            # Write to a temp file first so a reader never sees a partial thumbnail
+            tmp_path = f"{thumbnail_path}.{threading.get_ident()}.tmp"
+            image.save(tmp_path, 'JPEG', quality=85)
+            os.replace(tmp_path, thumbnail_path)
+            
+            return thumbnail_path
+        except Exception as e:
+            logging.error(f"Error creating thumbnail for {image_path}: {e}")
+            return None
+
+    def _thumbnail_key(self, image_path: str) -> str:
+        """Get the cache key of an image's thumbnails from its path and modification time"""
+        mtime = os.path.getmtime(image_path)
+        return hashlib.blake2b(f"{image_path}{mtime}".encode(), digest_size=16).hexdigest()
+        
+    def _thumbnail_path(self, image_path: str, size: int = 400) -> str:
+        """Get the (possibly not yet written) thumbnail file for an image"""
+        return os.path.join(self.thumbnails_dir, f"{self._thumbnail_key(image_path)}_{size}.jpg")
+
+    def prewarm_thumbnails(self):
+        """Create thumbnails for all order images and prune stale cache files, once per session"""
+        if self._thumbnails_prewarmed:
+            return
+        self._thumbnails_prewarmed = True
+        image_paths = [order.image_uri for order in self._orders if order.image_uri]
+        
+        def _prewarm():
+            live_keys = set()
+            for image_path in image_paths:
+                if os.path.exists(image_path):
+                    self.get_thumbnail_path(image_path)
+                    live_keys.add(self._thumbnail_key(image_path))
+            self._sweep_caches(live_keys)
+                    
+        threading.Thread(target=_prewarm, daemon=True).start()
+        
+    def _sweep_caches(self, live_keys: set):
+        """
+        Remove thumbnails of images that changed or no longer exist, and OCR text
+        that hasn't been used for OCR_CACHE_MAX_AGE
+        
+        Args:
+            live_keys: Thumbnail keys of the current order images
+        """
+        try:
+            for entry in os.scandir(self.thumbnails_dir):
+                if entry.name.endswith('.jpg') and entry.name.split('_', 1)[0] not in live_keys:
+                    os.remove(entry.path)
+                    
+            cutoff = time.time() - OCR_CACHE_MAX_AGE
+            for entry in os.scandir(self.ocr_cache_dir):
+                if entry.name.endswith('.txt') and entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+        except Exception as e:
+            logging.error(f"Error pruning image caches: {e}")
+
     def add_order(self, order_text: str) -> Optional[Order]:
         """
         Add a new order to the database and update the orders list
@@ -202,6 +456,11 @@ class OrderListViewModel:
                 )
                 if new_image_path:
                     order.image_uri = new_image_path
+                    # The stored image has the same content, so reuse its OCR text
+                    with self._ocr_lock:
+                        text = self._ocr_results.get(self._current_image_path)
+                        if text is not None:
+                            self._ocr_results[new_image_path] = text
                 
             # Set comment with picture flag
             order.comment_with_picture = self._comment_with_picture
@@ -210,8 +469,9 @@ class OrderListViewModel:
             order_id = self.db.insert_order(order)
             if order_id:
                 order.id = order_id
-                # Refresh orders list
-                self.load_orders()
+                # Orders are listed by creation time, so the new one goes last;
+                # no need to read every row back from the database
+                self.set_orders(self._orders + [order])
                 return order
                 
             return None
@@ -223,72 +483,140 @@ class OrderListViewModel:
         """
         Perform OCR in a background thread
         
+        Requests for an image that is already being processed share the
+        running job instead of starting another one.
+        
         Args:
             image_path: Path to the image file
             callback: Function to call with results
         """
-        threading.Thread(
-            target=self._ocr_thread,
-            args=(image_path, callback),
-            daemon=True
-        ).start()
-        
-    def _ocr_thread(self, image_path: str, callback=None):
+        with self._ocr_lock:
+            future = self._ocr_futures.get(image_path)
+            is_new = future is None
+            if is_new:
+                future = _OCR_POOL.submit(self._ocr_text, image_path)
+                self._ocr_futures[image_path] = future
+                
+        # Registered outside the lock since it runs at once if the job already finished
+        if is_new:
+            future.add_done_callback(partial(self._forget_ocr_job, image_path))
+        if callback:
+            future.add_done_callback(partial(self._deliver_ocr_result, callback))
+            
+    def _forget_ocr_job(self, image_path: str, future: Future):
         """
-        Thread function for OCR processing
+        Drop a finished or cancelled OCR job from the running jobs
         
         Args:
             image_path: Path to the image file
+            future: The OCR job that ended
+        """
+        with self._ocr_lock:
+            # A newer job for the same image may have replaced this one
+            if self._ocr_futures.get(image_path) is future:
+                del self._ocr_futures[image_path]
+            
+    def _deliver_ocr_result(self, callback: Callable, future: Future):
+        """
+        Pass the outcome of an OCR job to a callback
+        
+        Args:
             callback: Function to call with results
+            future: The finished OCR job
         """
-        if not load_pytesseract():
-            if callback:
-                callback(False, "Could not load OCR library")
+        # A job cancelled because another image was chosen has no result to report
+        if future.cancelled():
+            return
+        try:
+            text = future.result()
+        except Exception as e:
+            callback(False, str(e))
             return
+        callback(True, text)
+        
+    def _ocr_text(self, image_path: str) -> str:
+        """
+        Extract and cache the text of an image (runs in a worker thread)
+        
+        Args:
+            image_path: Path to the image file
             
+        Returns:
+            str: Extracted text from the image
+        """
         try:
             # Check if we already have results for this image
             with self._ocr_lock:
                 if image_path in self._ocr_results:
-                    if callback:
-                        callback(True, self._ocr_results[image_path])
-                    return
+                    return self._ocr_results[image_path]
                     
-            # Open the image
+            # Identical image content was already recognized, possibly in an earlier session
+            config = self.ocr_config
+            cache_path = self._ocr_cache_path(image_path, config)
+            if os.path.exists(cache_path):
+                with open(cache_path, encoding='utf-8') as cache_file:
+                    text = cache_file.read()
+                # Mark the entry as recently used so the cache sweep keeps it
+                os.utime(cache_path)
+                with self._ocr_lock:
+                    self._ocr_results[image_path] = text
+                return text
+                
+            if not load_pytesseract():
+                raise RuntimeError("Could not load OCR library")
+                
+            # Open the image; JPEGs are decoded at a reduced scale when they are far
+            # larger than the size OCR works at
+            from PIL import Image
             image = Image.open(image_path)
+            image.draft('RGB', (OCR_MAX_SIDE, OCR_MAX_SIDE))
             
-            # Convert PNG with transparency to RGB
-            if image.mode == 'RGBA':
-                # Create a white background image
-                background = Image.new('RGB', image.size, (255, 255, 255))
-                # Paste the image on the background
-                background.paste(image, mask=image.split()[3])  # 3 is the alpha channel
-                image = background
-            elif image.mode != 'RGB':
-                image = image.convert('RGB')
+            # Convert PNG with transparency to RGB on a white background
+            image = flatten_to_rgb(image)
             
-            # Extract text using pytesseract
-            text = pytesseract.image_to_string(image)
+            # Extract text using pytesseract from a smaller black and white copy
+            text = pytesseract.image_to_string(_prepare_for_ocr(image), config=config)
             
             # Clean up the extracted text
             text = text.strip()
             
-            # Cache the result
+            # Preprocessing can lose small or faint text, so retry on the original
+            if len(text) < OCR_MIN_TEXT_LENGTH:
+                text = pytesseract.image_to_string(image, config=config).strip()
+            
+            # Cache the result in memory and on disk
             with self._ocr_lock:
                 self._ocr_results[image_path] = text
+            # Write to a temp file first so a reader never sees partial text
+            tmp_path = f"{cache_path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as cache_file:
+                cache_file.write(text)
+            os.replace(tmp_path, cache_path)
                 
             # Log the result
             logging.info(f"OCR Result from {image_path}:")
             logging.info(text)
-            
-            # Call callback with result
-            if callback:
-                callback(True, text)
-                
+            return text
         except Exception as e:
             logging.error(f"Error extracting text from image: {e}")
-            if callback:
-                callback(False, str(e))
+            raise
+
+    def _ocr_cache_path(self, image_path: str, config: str) -> str:
+        """
+        Get the OCR cache file for an image, keyed by a hash of its content
+        
+        Args:
+            image_path: Path to the image file
+            config: Tesseract options the text is recognized with
+            
+        Returns:
+            str: Path to the (possibly not yet written) cache file
+        """
+        digest = hashlib.blake2b(config.encode(), digest_size=16)
+        with open(image_path, 'rb') as image_file:
+            for chunk in iter(partial(image_file.read, 1 << 20), b''):
+                digest.update(chunk)
+        return os.path.join(self.ocr_cache_dir, f"{digest.hexdigest()}.txt")
 
     def extract_text_from_image(self, image_path: str) -> str:
         """
@@ -300,45 +628,10 @@ class OrderListViewModel:
         Returns:
             str: Extracted text from the image
         """
-        # For immediate return without waiting for threading
-        if image_path in self._ocr_results:
-            return self._ocr_results[image_path]
-            
-        # Synchronous fallback mode for rapid startup
-        if not load_pytesseract():
-            return ""
-            
+        # Synchronous mode; the result is shared with later background requests
         try:
-            # Open the image
-            image = Image.open(image_path)
-            
-            # Convert PNG with transparency to RGB
-            if image.mode == 'RGBA':
-                # Create a white background image
-                background = Image.new('RGB', image.size, (255, 255, 255))
-                # Paste the image on the background
-                background.paste(image, mask=image.split()[3])  # 3 is the alpha channel
-                image = background
-            elif image.mode != 'RGB':
-                image = image.convert('RGB')
-            
-            # Extract text using pytesseract
-            text = pytesseract.image_to_string(image)
-            
-            # Clean up the extracted text
-            text = text.strip()
-            
-            # Cache the result
-            with self._ocr_lock:
-                self._ocr_results[image_path] = text
-            
-            # Log the result
-            logging.info(f"OCR Result from {image_path}:")
-            logging.info(text)
-            
-            return text
-        except Exception as e:
-            logging.error(f"Error extracting text from image: {e}")
+            return self._ocr_text(image_path)
+        except Exception:
             return ""
 
     def set_current_image(self, image_path: str) -> Tuple[bool, Optional[str]]:
@@ -352,6 +645,15 @@ class OrderListViewModel:
             Tuple[bool, Optional[str]]: (success, extracted_text)
         """
         try:
+            # Drop OCR for a previously selected image if it hasn't started yet
+            previous_path = self._current_image_path
+            if previous_path and previous_path != image_path:
+                with self._ocr_lock:
+                    future = self._ocr_futures.get(previous_path)
+                # Cancelling runs the job's done callbacks, which take the lock
+                if future is not None:
+                    future.cancel()
+                        
             self._current_image_path = image_path
             
             # If we already have OCR results for this image, return them immediately
@@ -380,11 +682,7 @@ class OrderListViewModel:
             callback(True, self._ocr_results[image_path])
             return
             
-        # Otherwise store callback and start OCR
-        with self._ocr_lock:
-            self._ocr_callbacks[image_path] = callback
-            
-        # Start OCR in background
+        # Otherwise wait for the OCR job started by set_current_image (or start one)
         self._perform_ocr(image_path, callback)
 
     def set_comment_with_picture(self, has_comment: bool):
@@ -419,30 +717,18 @@ class OrderListViewModel:
             Order: The order if found, None otherwise
         """
         try:
-            # Search in database first
+            # The loaded orders are kept in step with every change, so check them first
+            order = self._orders_by_id.get(order_id)
+            if order:
+                logging.info(f"Order found in local cache: {order.id}, {order.order_number}")
+                return order
+                
+            # Fall back to the database for orders that aren't loaded yet
             order_data = self.db.get_order_by_id(order_id)
             if order_data:
-                order = Order(
-                    id=order_data[0],
-                    order_number=order_data[1],
-                    amount=order_data[2],
-                    image_uri=order_data[3],
-                    comment_with_picture=order_data[4],
-                    commented=order_data[5],
-                    revealed=order_data[6],
-                    reimbursed=order_data[7],
-                    reimbursed_amount=order_data[8],
-                    note=order_data[9]
-                )
+                order = Order.from_row(order_data)
                 logging.info(f"Order found in database: {order.id}, {order.order_number}")
                 return order
-                
-            # Search in local cache
-            for order in self._orders:
-                if order.id == order_id:
-                    logging.info(f"Order found in local cache: {order.id}, {order.order_number}")
-                    return order
-                    
             return None
         except Exception as e:
             logging.error(f"Error getting order by id: {e}", exc_info=True)
@@ -462,18 +748,7 @@ class OrderListViewModel:
             # Search in database first
             order_data = self.db.get_order_by_number(order_number)
             if order_data:
-                order = Order(
-                    id=order_data[0],
-                    order_number=order_data[1],
-                    amount=order_data[2],
-                    image_uri=order_data[3],
-                    comment_with_picture=order_data[4],
-                    commented=order_data[5],
-                    revealed=order_data[6],
-                    reimbursed=order_data[7],
-                    reimbursed_amount=order_data[8],
-                    note=order_data[9]
-                )
+                order = Order.from_row(order_data)
                 logging.info(f"Order found in database: {order.id}, {order.order_number}")
                 return order
                 
@@ -501,13 +776,18 @@ class OrderListViewModel:
         """
         try:
             if self.db.update_order(order_id, order):
-                self.refresh()
+                # Swap in the saved values instead of reloading every row
+                updated_order = replace(order, id=order_id)
+                self.set_orders([
+                    updated_order if existing.id == order_id else existing
+                    for existing in self._orders
+                ])
                 return True
             return False
         except Exception as e:
             logging.error(f"Error updating order: {e}")
             return False
 
-    def __del__(self):
-        """Cleanup database connection"""
+    def close(self):
+        """Close the database connections; call once when the application exits"""
         self.db.close() 
\ No newline at end of file